@@ -26,24 +26,95 @@ Features:
 import os
 import sys
 import yaml
-import json
 import re
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass, field
+from typing import List, Any, Tuple, Optional
+from dataclasses import dataclass, field, fields
+from collections import Counter
 from enum import Enum
 import datetime
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 import traceback
 from urllib.parse import urlparse
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Patterns used on every validated file
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+(-rc\.\d+|-alpha\.\d+)?$')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_MARKDOWN_CHARS_DROP = str.maketrans('', '', '*_`')
+_AUTH_HEADER_RE = re.compile(r'#\s*Authorization\s+and\s+authentication', re.IGNORECASE)
+_ERROR_RESPONSES_HEADER_RE = re.compile(r'#\s*Additional\s+CAMARA\s+error\s+responses', re.IGNORECASE)
+_SCOPE_RE = re.compile(r'^[a-z0-9-]+:[a-z0-9-]+(?::[a-z0-9-]+)?$')
+_KEBAB_CASE_RE = re.compile(r'^[a-z0-9-]+$')
+_NON_KEBAB_CHARS_RE = re.compile(r'[^a-z0-9]+')
+_VERSION_SEGMENT_RE = re.compile(r'^v\d+')
+
+# Expected X-Correlator schema pattern (Commonalities v0.6)
+_XCORRELATOR_PATTERN = r'^\w{8}-\w{4}-4\w{3}-[89aAbB]\w{3}-\w{12}$'
+
+# Patterns used on test definition (.feature) files
+_TEST_URL_RE = re.compile(r'["\'](?:\{[^}]+\}/)?/?([a-zA-Z0-9_-]+)\/(vwip|wip|v\d+(?:\.\d+)?(?:rc\d+|alpha\d+)?)(\/[^"\']*)?["\']')
+_TEST_URL_NO_SLASH_RE = re.compile(r'["\'](?!\{[^}]+\}/)([a-zA-Z0-9_-]+\/(vwip|wip|v\d+(?:\.\d+)?(?:rc\d+|alpha\d+)?)(?:\/[^"\']*)?)["\']')
+_TEST_VERSION_RE = re.compile(r'v?\d+\.\d+\.\d+(?:-rc\.\d+|-alpha\.\d+)?')
+_TEST_OPERATION_RE = re.compile(r'request\s+"([^"]+)"')
+
+# Patterns used on command line arguments
+_COMMONALITIES_VERSION_RE = re.compile(r'\A\d+\.\d+\Z')
+_REPO_NAME_DROP_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+
+# HTTP methods treated as operations in a path item
+_HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'trace'})
+# Subset of methods covered by the CAMARA-specific operation checks
+_CORE_HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch'})
+# Modifying methods that should declare security requirements
+_MUTATING_HTTP_METHODS = frozenset({'post', 'put', 'delete'})
+# Methods expected on subscription CRUD endpoints
+_SUBSCRIPTION_CRUD_METHODS = frozenset({'get', 'post', 'put', 'delete'})
+
+# Response codes: any success code satisfies the check; error codes are
+# validated in this order, so they stay a tuple
+_SUCCESS_CODES = frozenset({'200', '201', '202', '204'})
+_ERROR_CODES = ('400', '401', '403', '404')
+# Properties every ErrorInfo schema must define, reported in this order
+_ERRORINFO_REQUIRED_PROPERTIES = ('code', 'message')
+
+# Common schemas that should be identical across all API files of a project
+_SHARED_SCHEMA_NAMES = (
+    'XCorrelator', 'ErrorInfo', 'Device', 'DeviceResponse', 
+    'PhoneNumber', 'NetworkAccessIdentifier', 'DeviceIpv4Addr', 
+    'DeviceIpv6Address', 'SingleIpv4Addr', 'Port', 'Point', 
+    'Latitude', 'Longitude', 'Area', 'AreaType', 'Circle'
+)
+
+# Schema keys ignored when comparing schemas across files
+_SCHEMA_ANNOTATION_KEYS = frozenset({'example', 'examples', 'description'})
+
+# Keywords used to recognise event-based (subscription) APIs
+_EVENT_SCHEMA_KEYWORDS = ('webhook', 'event', 'notification', 'callback')
+_EVENT_SCHEMA_NAME_KEYWORDS = ('webhook', 'event', 'notification', 'cloudevent')
+
+# Translation table escaping HTML/XML special characters in report content
+_HTML_ESCAPE_TRANS = str.maketrans({
+    "&": "&amp;",
+    '"': "&quot;",
+    "'": "&#x27;",
+    ">": "&gt;",
+    "<": "&lt;",
+})
+
 def safe_filename(filename: str, max_length: int = 200) -> str:
     """Sanitize filename to prevent path traversal and other issues"""
     # Remove any path components
     filename = os.path.basename(filename)
     
     # Replace dangerous characters
-    filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+    filename = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
     
     # Limit length
     if len(filename) > max_length:
@@ -51,11 +122,80 @@ def safe_filename(filename: str, max_length: int = 200) -> str:
         filename = name[:max_length-len(ext)-3] + "..." + ext
     
     # Ensure it's not empty or just dots
-    if not filename or filename.replace('.', '').replace('_', '') == '':
+    if not filename.strip('._'):
         filename = "sanitized_filename.md"
     
     return filename
 
+@functools.lru_cache(maxsize=512)
+def _load_api_spec_cached(file_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse an API definition file (keyed on stat info so edited files are re-read)"""
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+def load_api_spec(file_path: str) -> Any:
+    """Load an API definition, reusing the parsed spec if the file is unchanged
+    
+    The returned object is shared between callers and must not be mutated.
+    """
+    st = os.stat(file_path)
+    return _load_api_spec_cached(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+def normalize_template_text(text: str) -> str:
+    """Normalize text for template comparison (remove extra whitespace, make lowercase)"""
+    # Drop common markdown formatting that might vary, then collapse whitespace
+    # runs (including line breaks) to single spaces
+    return " ".join(text.lower().translate(_MARKDOWN_CHARS_DROP).split())
+
+def _template_patterns(components: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Pair each template component with its normalized form"""
+    return tuple((component, normalize_template_text(component)) for component in components)
+
+# Required authorization template components in info.description
+_AUTHORIZATION_TEMPLATE = _template_patterns((
+    "# Authorization and authentication",
+    "Camara Security and Interoperability Profile",
+    "Identity and Consent Management",
+    "github.com/camaraproject/IdentityAndConsentManagement",
+    "authorization flows to be used will be agreed upon during the onboarding process",
+    "three-legged access tokens is mandatory",
+    "privacy regulations"
+))
+
+# Required error responses template components in info.description (new in v0.6)
+_ERROR_RESPONSES_TEMPLATE = _template_patterns((
+    "# Additional CAMARA error responses",
+    "not exhaustive",
+    "CAMARA API Design Guide",
+    "CAMARA_common.yaml",
+    "Commonalities Release",
+    "API Readiness Checklist",
+    "501 - NOT_IMPLEMENTED"
+))
+
+def _worker_count(max_workers: Optional[int], task_count: int) -> int:
+    """Number of worker processes to use for task_count independent tasks"""
+    return min(max_workers or os.cpu_count() or 1, task_count)
+
+def _start_process_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """Start a pool of worker processes, or return None to run the tasks in-process"""
+    if workers < 2:
+        return None
+    try:
+        return ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError) as e:
+        # No usable multiprocessing primitives on this platform
+        print(f"  ⚠️ Worker processes unavailable ({e}), running sequentially")
+        return None
+
+def _print_result_counts(result: 'ValidationResult'):
+    """Print the API type and per-severity issue counts of a validated file"""
+    counts = result.severity_counts()
+    print(f"  📄 API Type: {result.api_type.value}")
+    print(f"  🔴 Critical: {counts[Severity.CRITICAL]}")
+    print(f"  🟡 Medium: {counts[Severity.MEDIUM]}")
+    print(f"  🔵 Low: {counts[Severity.LOW]}")
+
 def validate_directory_path(path: str) -> str:
     """Validate and normalize directory path"""
     # Convert to absolute path and resolve
@@ -73,22 +213,14 @@ def validate_directory_path(path: str) -> str:
 
 def sanitize_report_content(content: str) -> str:
     """Sanitize content for safe inclusion in reports"""
-    # Escape HTML/XML special characters to prevent injection
-    html_escape_table = {
-        "&": "&amp;",
-        '"': "&quot;",
-        "'": "&#x27;",
-        ">": "&gt;",
-        "<": "&lt;",
-    }
-    
-    # Replace problematic characters
-    for char, escape in html_escape_table.items():
-        content = content.replace(char, escape)
-    
-    # Limit content length to prevent DoS
+    # Limit content length to prevent DoS. Escaping never shortens text, so only
+    # the first max_length input characters can survive the final truncation.
     max_length = 1000000  # 1MB
-    if len(content) > max_length:
+    truncated = len(content) > max_length
+    
+    # Escape HTML/XML special characters to prevent injection (single pass)
+    content = content[:max_length].translate(_HTML_ESCAPE_TRANS)
+    if truncated or len(content) > max_length:
         content = content[:max_length] + "\n\n⚠️ **Content truncated due to size limits**"
     
     return content
@@ -104,43 +236,109 @@ class APIType(Enum):
     IMPLICIT_SUBSCRIPTION = "Implicit Subscription API"
     EXPLICIT_SUBSCRIPTION = "Explicit Subscription API"
 
-@dataclass
+# Severity ranking used to filter issues below the requested minimum
+_SEVERITY_ORDER = {
+    Severity.INFO: 0,
+    Severity.LOW: 1,
+    Severity.MEDIUM: 2,
+    Severity.CRITICAL: 3,
+}
+
+# API types that publish events
+_SUBSCRIPTION_API_TYPES = frozenset({APIType.IMPLICIT_SUBSCRIPTION, APIType.EXPLICIT_SUBSCRIPTION})
+
+# Indicator shown next to each API in the GitHub summary
+_API_TYPE_INDICATORS = {
+    APIType.EXPLICIT_SUBSCRIPTION: "🔔",
+    APIType.IMPLICIT_SUBSCRIPTION: "📧",
+    APIType.REGULAR: "📄",
+}
+
+# Fix suggestion shared by the server URL checks
+_SERVER_URL_FIX = "Ensure servers[*].url follows format: {apiRoot}/<api-name>/<api-version>"
+
+# Values read straight from the spec may be unhashable, so these stay tuples
+_ALLOWED_SCHEME_TYPES = ('openIdConnect', 'http')
+_DEPRECATED_ERROR_CODES = ('IDENTIFIER_MISMATCH',)
+
+# Manual review checks reported for every API, plus the extra ones per API type
+_MANUAL_CHECKS_COMMON = (
+    "Info.description for device or phone number (if applicable)",
+    "Business logic appropriateness review",
+    "Documentation quality assessment", 
+    "API design patterns validation",
+    "Use case coverage evaluation",
+    "Security considerations beyond structure",
+    "Performance implications assessment"
+)
+_MANUAL_CHECKS_BY_TYPE = {
+    APIType.REGULAR: _MANUAL_CHECKS_COMMON,
+    APIType.EXPLICIT_SUBSCRIPTION: _MANUAL_CHECKS_COMMON + (
+        "Subscription lifecycle management review",
+        "Event delivery mechanism validation", 
+        "Webhook endpoint security review",
+        "Subscription filtering logic validation"
+    ),
+    APIType.IMPLICIT_SUBSCRIPTION: _MANUAL_CHECKS_COMMON + (
+        "Event callback mechanism review",
+        "Implicit subscription trigger validation",
+        "Event payload structure review"
+    ),
+}
+
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     severity: Severity
     category: str
     description: str
     location: str = ""
     fix_suggestion: str = ""
+    
+    def __post_init__(self):
+        # Categories repeat across many issues; share one copy of each
+        object.__setattr__(self, 'category', sys.intern(self.category))
+    
+    def __reduce__(self):
+        # Rebuild through __init__ so issues returned by worker processes are interned too
+        return (ValidationIssue, tuple(getattr(self, f.name) for f in fields(self)))
 
-@dataclass
-class ValidationResult:
-    file_path: str
-    api_name: str = ""
-    version: str = ""
-    api_type: APIType = APIType.REGULAR
-    issues: List[ValidationIssue] = field(default_factory=list)
-    checks_performed: List[str] = field(default_factory=list)
-    manual_checks_needed: List[str] = field(default_factory=list)
+class _SeverityCounts:
+    """Per-severity issue counts for result classes with an issues list"""
+    __slots__ = ()
+    
+    def severity_counts(self) -> Counter:
+        """Count issues per severity in a single pass"""
+        return Counter(i.severity for i in self.issues)
     
     @property
     def critical_count(self) -> int:
-        return len([i for i in self.issues if i.severity == Severity.CRITICAL])
+        return self.severity_counts()[Severity.CRITICAL]
     
     @property
     def medium_count(self) -> int:
-        return len([i for i in self.issues if i.severity == Severity.MEDIUM])
+        return self.severity_counts()[Severity.MEDIUM]
     
     @property
     def low_count(self) -> int:
-        return len([i for i in self.issues if i.severity == Severity.LOW])
+        return self.severity_counts()[Severity.LOW]
 
-@dataclass
-class ConsistencyResult:
+@dataclass(slots=True)
+class ValidationResult(_SeverityCounts):
+    file_path: str
+    api_name: str = ""
+    version: str = ""
+    api_type: APIType = APIType.REGULAR
+    issues: List[ValidationIssue] = field(default_factory=list)
+    checks_performed: List[str] = field(default_factory=list)
+    manual_checks_needed: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class ConsistencyResult(_SeverityCounts):
     issues: List[ValidationIssue] = field(default_factory=list)
     checks_performed: List[str] = field(default_factory=list)
 
-@dataclass
-class TestAlignmentResult:
+@dataclass(slots=True)
+class TestAlignmentResult(_SeverityCounts):
     api_file: str
     test_files: List[str] = field(default_factory=list)
     issues: List[ValidationIssue] = field(default_factory=list)
@@ -149,13 +347,19 @@ class TestAlignmentResult:
 class CAMARAAPIValidator:
     """CAMARA API Validator for Commonalities v0.6"""
 
-    def __init__(self, commonalities_version: str = "0.6", review_type: str = "release-candidate"):
+    def __init__(self, commonalities_version: str = "0.6", review_type: str = "release-candidate",
+                 min_severity: Severity = Severity.INFO):
         """Initialize validator with version validation"""
         self.expected_commonalities_version = commonalities_version
         self.implemented_version = "0.6"  # This validator only implements v0.6 rules
         self.api_spec = None  # Will store the API spec for reference resolution
         self.review_type = review_type  # Store review type for validation behavior
+        self.min_severity = min_severity  # Issues below this severity are not recorded
+        self._min_severity_rank = _SEVERITY_ORDER[min_severity]
         self._current_api_name = None  # Store current API name for type detection
+        self._current_api_type = None  # Detected API type of the file being validated
+        self._operations = []  # (path, method, operation) tuples of the file being validated
+        self._ref_cache = {}  # Resolved $ref targets of the file being validated
 
         # Warn if requested version doesn't match implemented version
         if self.expected_commonalities_version != self.implemented_version:
@@ -164,22 +368,36 @@ class CAMARAAPIValidator:
             print(f"⚠️ For accurate v{self.expected_commonalities_version} validation, please use the appropriate validator script")
     
 
+    def _add_issue(self, result: Any, severity: Severity, category: str, description: str,
+                   location: str = "", fix_suggestion: str = ""):
+        """Record an issue on a result unless it is below the configured minimum severity"""
+        if _SEVERITY_ORDER[severity] < self._min_severity_rank:
+            return
+        result.issues.append(ValidationIssue(severity, category, description, location, fix_suggestion))
+
     def _resolve_reference(self, ref: str, api_spec: dict) -> dict:
         """Resolve $ref reference within the API specification"""
         if not ref.startswith('#/'):
             return {}
         
-        # Remove the '#/' prefix and split by '/'
-        path_parts = ref[2:].split('/')
+        cache_key = (id(api_spec), ref)
+        if cache_key in self._ref_cache:
+            return self._ref_cache[cache_key]
+        
+        # Remove the '#/' prefix and split by '/', unescaping JSON Pointer tokens (RFC 6901)
+        path_parts = [part.replace('~1', '/').replace('~0', '~') for part in ref[2:].split('/')]
         
         current = api_spec
         for part in path_parts:
             if isinstance(current, dict) and part in current:
                 current = current[part]
             else:
-                return {}
+                current = {}
+                break
         
-        return current if isinstance(current, dict) else {}
+        resolved = current if isinstance(current, dict) else {}
+        self._ref_cache[cache_key] = resolved
+        return resolved
 
     def _get_expected_url_suffix(self, version: str) -> Optional[str]:
         """Convert API version to expected URL suffix according to CAMARA conventions
@@ -191,7 +409,7 @@ class CAMARAAPIValidator:
             return '/vwip'
         
         # Validate version format
-        if not re.match(r'^\d+\.\d+\.\d+(-rc\.\d+|-alpha\.\d+)?$', version):
+        if not _SEMVER_RE.match(version):
             return None
         
         # Parse version components
@@ -225,21 +443,21 @@ class CAMARAAPIValidator:
             info = api_spec.get('info', {})
             declared_version = info.get('x-camara-commonalities', 'not specified')
             
-            result.issues.append(ValidationIssue(
-                Severity.INFO, "Version Mismatch",
+            self._add_issue(
+                result, Severity.INFO, "Version Mismatch",
                 f"Validating with v{self.implemented_version} rules (requested v{self.expected_commonalities_version})",
                 "validator",
                 f"This validator implements Commonalities v{self.implemented_version} compliance checks"
-            ))
+            )
             
             # Also check if API declares a different commonalities version
             if declared_version != 'not specified' and declared_version != self.implemented_version:
-                result.issues.append(ValidationIssue(
-                    Severity.LOW, "Commonalities Version",
+                self._add_issue(
+                    result, Severity.LOW, "Commonalities Version",
                     f"API declares commonalities v{declared_version} but is being validated against v{self.implemented_version} rules",
                     "info.x-camara-commonalities",
                     f"Results may not accurately reflect v{declared_version} compliance"
-                ))
+                )
 
     def validate_api_file(self, file_path: str) -> ValidationResult:
         """Validate a single API file"""
@@ -247,11 +465,14 @@ class CAMARAAPIValidator:
         result.checks_performed.append(f"CAMARA Commonalities {self.expected_commonalities_version} validation")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                api_spec = yaml.safe_load(f)
+            self._current_api_type = None
+            self._ref_cache = {}
+            api_spec = load_api_spec(file_path)
             
-            # Store API spec for reference resolution
+            # Store API spec for reference resolution, and collect its
+            # operations once for all path-walking checks
             self.api_spec = api_spec
+            self._operations = self._collect_operations(api_spec)
 
             # Extract basic info
             info = api_spec.get('info', {})
@@ -261,13 +482,13 @@ class CAMARAAPIValidator:
 
             # Fallback to filename if servers extraction fails
             if not api_name:
-                api_name = Path(file_path).stem
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Server Configuration",
+                api_name = os.path.splitext(os.path.basename(file_path))[0]
+                self._add_issue(
+                    result, Severity.MEDIUM, "Server Configuration",
                     "Cannot extract api-name from servers[*].url",
                     "servers",
-                    "Ensure servers[*].url follows format: {apiRoot}/<api-name>/<api-version>"
-                ))
+                    _SERVER_URL_FIX
+                )
 
             self._current_api_name = api_name
             result.api_name = api_name
@@ -276,6 +497,7 @@ class CAMARAAPIValidator:
             
             # Detect API type first for targeted validation
             result.api_type = self._detect_api_type(api_spec, api_name)
+            self._current_api_type = result.api_type
             result.checks_performed.append(f"API type detection: {result.api_type.value}")
 
             # Check for Commonalities version mismatch
@@ -313,43 +535,96 @@ class CAMARAAPIValidator:
             result.manual_checks_needed = self._get_manual_checks_for_type(result.api_type)
             
         except yaml.YAMLError as e:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "YAML Syntax", f"YAML parsing error: {str(e)}"
-            ))
+            self._add_issue(
+                result, Severity.CRITICAL, "YAML Syntax", f"YAML parsing error: {str(e)}"
+            )
         except Exception as e:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Validation Error", f"Unexpected error: {str(e)}"
-            ))
+            self._add_issue(
+                result, Severity.CRITICAL, "Validation Error", f"Unexpected error: {str(e)}"
+            )
         
         return result
 
+    def validate_files(self, file_paths: List[str], max_workers: Optional[int] = None,
+                       verbose: bool = False) -> List[ValidationResult]:
+        """Validate several API files in worker processes, returning results in input order
+        
+        With verbose, each file is logged as it is validated: before the call when
+        running in-process, and as its result arrives when using worker processes.
+        """
+        results = []
+        executor = _start_process_pool(_worker_count(max_workers, len(file_paths)))
+        if executor is None:
+            for file_path in file_paths:
+                if verbose:
+                    print(f"\n📋 Validating {file_path}...")
+                results.append(self._validate_file_safely(file_path, verbose))
+            return results
+        
+        with executor:
+            futures = [executor.submit(self.validate_api_file, file_path) for file_path in file_paths]
+            for file_path, future in zip(file_paths, futures):
+                try:
+                    result = future.result()
+                    error = None
+                except Exception as e:
+                    error = e
+                if verbose:
+                    print(f"\n📋 Validated {file_path}")
+                if error is not None:
+                    results.append(self._validation_error_result(file_path, error))
+                    continue
+                if verbose:
+                    _print_result_counts(result)
+                results.append(result)
+            return results
+
+    def _validate_file_safely(self, file_path: str, verbose: bool = False) -> ValidationResult:
+        """Validate a single API file, turning unexpected failures into an error result"""
+        try:
+            result = self.validate_api_file(file_path)
+        except Exception as e:
+            return self._validation_error_result(file_path, e)
+        if verbose:
+            _print_result_counts(result)
+        return result
+
+    def _validation_error_result(self, file_path: str, error: Exception) -> ValidationResult:
+        """Build the result reported for a file whose validation failed outright"""
+        print(f"  ❌ Error validating {file_path}: {str(error)}")
+        error_result = ValidationResult(file_path=file_path)
+        self._add_issue(
+            error_result, Severity.CRITICAL, "Validation Error", f"Failed to validate file: {str(error)}"
+        )
+        return error_result
+
     def _get_manual_checks_for_type(self, api_type: APIType) -> List[str]:
         """Get manual checks needed based on API type"""
-        common_checks = [
-            "Info.description for device or phone number (if applicable)",
-            "Business logic appropriateness review",
-            "Documentation quality assessment", 
-            "API design patterns validation",
-            "Use case coverage evaluation",
-            "Security considerations beyond structure",
-            "Performance implications assessment"
-        ]
-        
-        if api_type == APIType.EXPLICIT_SUBSCRIPTION:
-            return common_checks + [
-                "Subscription lifecycle management review",
-                "Event delivery mechanism validation", 
-                "Webhook endpoint security review",
-                "Subscription filtering logic validation"
-            ]
-        elif api_type == APIType.IMPLICIT_SUBSCRIPTION:
-            return common_checks + [
-                "Event callback mechanism review",
-                "Implicit subscription trigger validation",
-                "Event payload structure review"
-            ]
-        
-        return common_checks
+        # Copy so each result owns its list
+        return list(_MANUAL_CHECKS_BY_TYPE.get(api_type, _MANUAL_CHECKS_COMMON))
+
+    def _collect_operations(self, api_spec: dict) -> List[Tuple[str, str, dict]]:
+        """Collect (path, method, operation) for every operation object in paths"""
+        operations = []
+        paths = api_spec.get('paths', {})
+        for path, path_obj in paths.items():
+            if isinstance(path_obj, dict):
+                for method, operation in path_obj.items():
+                    if method in _HTTP_METHODS and isinstance(operation, dict):
+                        operations.append((path, method, operation))
+        return operations
+
+    def _operations_of(self, api_spec: dict) -> List[Tuple[str, str, dict]]:
+        """Operations of api_spec, reusing those collected for the file being validated"""
+        if api_spec is self.api_spec:
+            return self._operations
+        return self._collect_operations(api_spec)
+
+    def _get_api_type(self, api_spec: dict) -> APIType:
+        """Return the API type of the file being validated, detecting it only once"""
+        if self._current_api_type is None:
+            self._current_api_type = self._detect_api_type(api_spec)
+        return self._current_api_type
 
     def _detect_api_type(self, api_spec: dict, api_name: str = None) -> APIType:
         """Enhanced API type detection with better subscription pattern recognition"""
@@ -368,61 +643,58 @@ class CAMARAAPIValidator:
                 api_name_lower.endswith('_subscriptions')
             )
         
-        # Check for explicit subscription endpoints
-        subscription_patterns = ['/subscriptions', '/subscription']
-        for path in paths.keys():
-            for pattern in subscription_patterns:
-                if pattern in path.lower():
-                    return APIType.EXPLICIT_SUBSCRIPTION
+        # Check for explicit subscription endpoints ('/subscription' also covers '/subscriptions');
+        # paths are lowercased in one go, the newline separator keeps matches within one path
+        if '/subscription' in '\n'.join(paths).lower():
+            return APIType.EXPLICIT_SUBSCRIPTION
         
         # Check for webhook/event patterns in responses or callbacks
-        for path, path_obj in paths.items():
-            if isinstance(path_obj, dict):
-                for method, operation in path_obj.items():
-                    if method in ['get', 'post', 'put', 'delete', 'patch'] and isinstance(operation, dict):
-                        # Check callbacks (implicit subscription indicator)
-                        if 'callbacks' in operation:
-                            return APIType.IMPLICIT_SUBSCRIPTION
-                        
-                        # Check responses for event patterns
-                        responses = operation.get('responses', {})
-                        for response in responses.values():
-                            if isinstance(response, dict):
-                                # Check content types for event patterns
-                                content = response.get('content', {})
-                                for media_type, media_obj in content.items():
-                                    if isinstance(media_obj, dict):
-                                        schema = media_obj.get('schema', {})
-                                        schema_str = str(schema).lower()
-                                        if any(keyword in schema_str for keyword in ['webhook', 'event', 'notification', 'callback']):
-                                            return APIType.IMPLICIT_SUBSCRIPTION
+        for path, method, operation in self._operations_of(api_spec):
+            if method in _CORE_HTTP_METHODS:
+                # Check callbacks (implicit subscription indicator)
+                if 'callbacks' in operation:
+                    return APIType.IMPLICIT_SUBSCRIPTION
+                
+                # Check responses for event patterns
+                responses = operation.get('responses', {})
+                for response in responses.values():
+                    if isinstance(response, dict):
+                        # Check content types for event patterns
+                        content = response.get('content', {})
+                        for media_type, media_obj in content.items():
+                            if isinstance(media_obj, dict):
+                                schema = media_obj.get('schema', {})
+                                # str() of the schema is rendered in C, which is cheaper than walking it
+                                schema_str = str(schema).lower()
+                                if any(keyword in schema_str for keyword in _EVENT_SCHEMA_KEYWORDS):
+                                    return APIType.IMPLICIT_SUBSCRIPTION
         
         # Check components for subscription-related schemas
         components = api_spec.get('components', {})
         schemas = components.get('schemas', {})
-        has_event_subscription_schema = False
         has_event_schema = False
 
+        # Subscription paths were ruled out above, so an event subscription schema
+        # only marks an explicit subscription API together with the naming convention.
+        # Without that convention the first event schema settles the decision.
         for schema_name, schema_def in schemas.items():
             schema_name_lower = schema_name.lower()
             
             # Check for event/notification schemas
-            if any(keyword in schema_name_lower for keyword in ['webhook', 'event', 'notification', 'cloudevent']):
+            if any(keyword in schema_name_lower for keyword in _EVENT_SCHEMA_NAME_KEYWORDS):
+                if not is_subscription_api_by_name:
+                    return APIType.IMPLICIT_SUBSCRIPTION
                 has_event_schema = True
             
             # Check for subscription schemas with SubscriptionId property
-            elif 'subscription' in schema_name_lower:
+            elif is_subscription_api_by_name and 'subscription' in schema_name_lower:
                 if isinstance(schema_def, dict):
                     properties = schema_def.get('properties', {})
                     # Event subscription schemas have SubscriptionId
                     if 'subscriptionId' in properties or 'SubscriptionId' in properties:
-                        has_event_subscription_schema = True
+                        return APIType.EXPLICIT_SUBSCRIPTION
 
-        # Make decision based on multiple factors
-        if has_event_subscription_schema and (is_subscription_api_by_name or 
-                                            any('/subscription' in path for path in paths.keys())):
-            return APIType.EXPLICIT_SUBSCRIPTION
-        elif has_event_schema:
+        if has_event_schema:
             return APIType.IMPLICIT_SUBSCRIPTION
 
         return APIType.REGULAR
@@ -435,132 +707,118 @@ class CAMARAAPIValidator:
                 
         info = api_spec.get('info', {})
         if not info:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Info Object", 
+            self._add_issue(
+                result, Severity.CRITICAL, "Info Object", 
                 "Missing required `info` object"
-            ))
+            )
             return
         
         # Title validation
         title = info.get('title', '')
         if not title:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Info Object",
+            self._add_issue(
+                result, Severity.CRITICAL, "Info Object",
                 "Missing required `title` field",
                 "info.title"
-            ))
+            )
         elif 'API' in title:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Info Object",
+            self._add_issue(
+                result, Severity.MEDIUM, "Info Object",
                 f"Title should not include 'API': `{title}`",
                 "info.title",
                 "Remove 'API' from title"
-            ))
+            )
         
         # Version check (for wip detection)
         version = info.get('version', '')
-        if version != 'wip' and not re.match(r'^\d+\.\d+\.\d+(-rc\.\d+|-alpha\.\d+)?$', version):
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Info Object",
+        if version != 'wip' and not _SEMVER_RE.match(version):
+            self._add_issue(
+                result, Severity.CRITICAL, "Info Object",
                 f"Invalid version format: `{version}`",
                 "info.version",
                 "Use semantic versioning (`x.y.z` or `x.y.z-rc.n` or `x.y.z-alpha.n`)"
-            ))
+            )
         
         # License check
         license_info = info.get('license', {})
         if license_info.get('name') != 'Apache 2.0':
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Info Object",
+            self._add_issue(
+                result, Severity.CRITICAL, "Info Object",
                 "License must be `Apache 2.0`",
                 "info.license.name"
-            ))
+            )
         
         if license_info.get('url') != 'https://www.apache.org/licenses/LICENSE-2.0.html':
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Info Object",
+            self._add_issue(
+                result, Severity.CRITICAL, "Info Object",
                 "Incorrect license URL",
                 "info.license.url"
-            ))
+            )
 
         # Mandatory template validations
         description = info.get('description', '')
-        self._validate_authorization_template(description, result)
-        self._validate_error_responses_template(description, result)
+        normalized_desc = self._normalize_text_for_template_check(description) if description else ''
+        self._validate_authorization_template(description, normalized_desc, result)
+        self._validate_error_responses_template(description, normalized_desc, result)
 
         # Commonalities version
         commonalities = info.get('x-camara-commonalities')
         if str(commonalities) != self.expected_commonalities_version:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Info Object",
+            self._add_issue(
+                result, Severity.MEDIUM, "Info Object",
                 f"Expected commonalities `{self.expected_commonalities_version}`, found: `{commonalities}`",
                 "info.x-camara-commonalities"
-            ))
+            )
         
         # Forbidden fields
         if 'termsOfService' in info:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Info Object",
+            self._add_issue(
+                result, Severity.MEDIUM, "Info Object",
                 "`termsOfService` should not be in the API definition",
                 "info.termsOfService",
                 "Remove `termsOfService` field"
-            ))
+            )
 
     def _normalize_text_for_template_check(self, text: str) -> str:
         """Normalize text for template comparison (remove extra whitespace, make lowercase)"""
-        # Remove extra whitespace, normalize line breaks, make lowercase
-        normalized = re.sub(r'\s+', ' ', text.strip().lower())
-        # Remove common markdown formatting that might vary
-        normalized = re.sub(r'[*_`]', '', normalized)
-        return normalized
+        return normalize_template_text(text)
+
+    def _find_missing_template_components(self, normalized_desc: str, 
+                                          template: Tuple[Tuple[str, str], ...]) -> List[str]:
+        """Return the template components not present in the normalized description"""
+        return [component for component, pattern in template if pattern not in normalized_desc]
 
-    def _validate_authorization_template(self, description: str, result: ValidationResult):
+    def _validate_authorization_template(self, description: str, normalized_desc: str,
+                                         result: ValidationResult):
         """Validate mandatory authorization template in info.description"""
         if not description:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Authorization Template",
+            self._add_issue(
+                result, Severity.CRITICAL, "Authorization Template",
                 "Missing info.description - required for authorization template",
                 "info.description"
-            ))
+            )
             return
         
-        # Required authorization template components
-        required_components = [
-            "# Authorization and authentication",
-            "Camara Security and Interoperability Profile",
-            "Identity and Consent Management",
-            "github.com/camaraproject/IdentityAndConsentManagement",
-            "authorization flows to be used will be agreed upon during the onboarding process",
-            "three-legged access tokens is mandatory",
-            "privacy regulations"
-        ]
-        
-        # Normalize description for checking
-        normalized_desc = self._normalize_text_for_template_check(description)
-        
-        missing_components = []
-        for component in required_components:
-            normalized_component = self._normalize_text_for_template_check(component)
-            if normalized_component not in normalized_desc:
-                missing_components.append(component)
+        missing_components = self._find_missing_template_components(normalized_desc, _AUTHORIZATION_TEMPLATE)
         
         if missing_components:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Authorization Template",
+            self._add_issue(
+                result, Severity.CRITICAL, "Authorization Template",
                 f"Missing required authorization template components: {', '.join(missing_components)}",
                 "info.description",
                 "Add the mandatory authorization template as specified in CAMARA-API-access-and-user-consent.md"
-            ))
+            )
         
         # Check for required header specifically
-        if not re.search(r'#\s*Authorization\s+and\s+authentication', description, re.IGNORECASE):
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Authorization Template",
+        if not _AUTH_HEADER_RE.search(description):
+            self._add_issue(
+                result, Severity.CRITICAL, "Authorization Template",
                 "Missing required '# Authorization and authentication' header",
                 "info.description"
-            ))
+            )
 
-    def _validate_error_responses_template(self, description: str, result: ValidationResult):
+    def _validate_error_responses_template(self, description: str, normalized_desc: str,
+                                           result: ValidationResult):
         """Validate mandatory error responses template in info.description (new in v0.6)"""
         if not description:
             # Already reported in authorization template check
@@ -574,41 +832,23 @@ class CAMARAAPIValidator:
         except (ValueError, AttributeError):
             pass  # If version parsing fails, include the check
         
-        # Required error responses template components
-        required_components = [
-            "# Additional CAMARA error responses",
-            "not exhaustive",
-            "CAMARA API Design Guide",
-            "CAMARA_common.yaml",
-            "Commonalities Release",
-            "API Readiness Checklist",
-            "501 - NOT_IMPLEMENTED"
-        ]
-        
-        # Normalize description for checking
-        normalized_desc = self._normalize_text_for_template_check(description)
-        
-        missing_components = []
-        for component in required_components:
-            normalized_component = self._normalize_text_for_template_check(component)
-            if normalized_component not in normalized_desc:
-                missing_components.append(component)
+        missing_components = self._find_missing_template_components(normalized_desc, _ERROR_RESPONSES_TEMPLATE)
         
         if missing_components:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Error Responses Template",
+            self._add_issue(
+                result, Severity.CRITICAL, "Error Responses Template",
                 f"Missing required error responses template components: {', '.join(missing_components)}",
                 "info.description",
                 "Add the mandatory 'Additional CAMARA error responses' template as specified in CAMARA API Design Guide v0.6"
-            ))
+            )
         
         # Check for required header specifically
-        if not re.search(r'#\s*Additional\s+CAMARA\s+error\s+responses', description, re.IGNORECASE):
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Error Responses Template",
+        if not _ERROR_RESPONSES_HEADER_RE.search(description):
+            self._add_issue(
+                result, Severity.CRITICAL, "Error Responses Template",
                 "Missing required '# Additional CAMARA error responses' header",
                 "info.description"
-            ))
+            )
 
     def _validate_external_docs(self, api_spec: dict, result: ValidationResult):
         """Validate external documentation"""
@@ -616,34 +856,34 @@ class CAMARAAPIValidator:
         
         external_docs = api_spec.get('externalDocs')
         if not external_docs:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "ExternalDocs",
+            self._add_issue(
+                result, Severity.CRITICAL, "ExternalDocs",
                 "Missing externalDocs object",
                 "externalDocs",
                 "Add externalDocs with description and url"
-            ))
+            )
             return
         
         if not external_docs.get('description'):
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "ExternalDocs",
+            self._add_issue(
+                result, Severity.MEDIUM, "ExternalDocs",
                 "Missing externalDocs description",
                 "externalDocs.description"
-            ))
+            )
         
         url = external_docs.get('url', '')
         if not url:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "ExternalDocs",
+            self._add_issue(
+                result, Severity.CRITICAL, "ExternalDocs",
                 "Missing externalDocs URL",
                 "externalDocs.url"
-            ))
+            )
         elif not url.startswith('https://'):
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "ExternalDocs",
+            self._add_issue(
+                result, Severity.MEDIUM, "ExternalDocs",
                 "External docs URL should use HTTPS",
                 "externalDocs.url"
-            ))
+            )
 
     def _validate_servers(self, api_spec: dict, result: ValidationResult):
         """Validate servers configuration"""
@@ -651,27 +891,27 @@ class CAMARAAPIValidator:
         
         servers = api_spec.get('servers', [])
         if not servers:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Servers",
+            self._add_issue(
+                result, Severity.MEDIUM, "Servers",
                 "No servers defined",
                 "servers"
-            ))
+            )
             return
         
         for i, server in enumerate(servers):
             url = server.get('url', '')
             if not url:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Servers",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Servers",
                     f"Server {i+1} missing URL",
                     f"servers[{i}].url"
-                ))
+                )
             elif not url.startswith(('https://', '{apiRoot}')):
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Servers",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Servers",
                     f"Server URL should use HTTPS or template: `{url}`",
                     f"servers[{i}].url"
-                ))
+                )
 
     def _validate_paths(self, api_spec: dict, result: ValidationResult):
         """Validate paths object with comprehensive operation checks"""
@@ -679,188 +919,164 @@ class CAMARAAPIValidator:
         
         paths = api_spec.get('paths', {})
         if not paths:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Paths",
+            self._add_issue(
+                result, Severity.CRITICAL, "Paths",
                 "No paths defined"
-            ))
+            )
             return
         
         # Get api_name for security validation
         api_name = self._current_api_name if hasattr(self, '_current_api_name') else ''
         
-        for path, path_obj in paths.items():
-            if not isinstance(path_obj, dict):
-                continue
-                
-            for method, operation in path_obj.items():
-                if method in ['get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'trace']:
-                    self._validate_operation(operation, f"{method.upper()} {path}", result)
-                    
-                    # Add security validation with proper parameters
-                    if isinstance(operation, dict):
-                        self._validate_operation_security(operation, path, method, api_name, result)
+        for path, method, operation in self._operations_of(api_spec):
+            self._validate_operation(operation, method, path, result)
+            
+            # Add security validation with proper parameters
+            self._validate_operation_security(operation, path, method, api_name, result)
 
-    def _validate_operation(self, operation: dict, operation_name: str, result: ValidationResult):
+    def _validate_operation(self, operation: dict, method: str, path: str, result: ValidationResult):
         """Validate individual operation with detailed checks"""
         if not isinstance(operation, dict):
             return
         
+        operation_name = f"{method.upper()} {path}"
+        
         # Check for operationId
         if 'operationId' not in operation:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Operation",
+            self._add_issue(
+                result, Severity.CRITICAL, "Operation",
                 "Missing operationId",
                 operation_name
-            ))
+            )
         
         # Check summary and description
         if 'summary' not in operation:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Operation",
+            self._add_issue(
+                result, Severity.MEDIUM, "Operation",
                 "Missing summary",
                 operation_name
-            ))
+            )
         
         if 'description' not in operation:
-            result.issues.append(ValidationIssue(
-                Severity.LOW, "Operation",
+            self._add_issue(
+                result, Severity.LOW, "Operation",
                 "Missing description",
                 operation_name
-            ))
+            )
         
         # Check responses
         responses = operation.get('responses', {})
         if not responses:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Operation",
+            self._add_issue(
+                result, Severity.CRITICAL, "Operation",
                 "No responses defined",
                 operation_name
-            ))
+            )
         else:
             self._validate_responses(responses, operation_name, result)
         
         # Check security for operations that need it
         security = operation.get('security')
-        if security is None and operation_name.startswith(('POST', 'PUT', 'DELETE')):
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Operation",
+        if security is None and method in _MUTATING_HTTP_METHODS:
+            self._add_issue(
+                result, Severity.MEDIUM, "Operation",
                 "Consider adding security requirements for modifying operations",
                 operation_name
-            ))
+            )
 
     def _validate_responses(self, responses: dict, operation_name: str, result: ValidationResult):
         """Validate response definitions"""
         # Check for success response
-        success_codes = ['200', '201', '202', '204']
-        has_success = any(code in responses for code in success_codes)
+        has_success = isinstance(responses, dict) and not _SUCCESS_CODES.isdisjoint(responses)
         
         if not has_success:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Responses",
+            self._add_issue(
+                result, Severity.MEDIUM, "Responses",
                 "No success response (2xx) defined",
                 f"{operation_name}.responses"
-            ))
+            )
         
         # Check for error responses
-        error_codes = ['400', '401', '403', '404']
-        for code in error_codes:
-            if code in responses:
-                response = responses[code]
-                if isinstance(response, dict):
-                    self._validate_error_response(response, code, operation_name, result)
-
-    def _validate_error_response(self, response: dict, status_code: str, operation_name: str, result: ValidationResult):
-        """Validate error response structure"""
-        content = response.get('content', {})
-        
-        # Check for application/json content type
-        if 'application/json' not in content:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Error Responses",
-                f"Error response {status_code} should have application/json content",
-                f"{operation_name}.responses.{status_code}"
-            ))
+        if not isinstance(responses, dict):
             return
-        
-        # Check for ErrorInfo schema reference
-        json_content = content.get('application/json', {})
-        schema = json_content.get('schema', {})
-        
-        if isinstance(schema, dict):
-            ref = schema.get('$ref', '')
-            if '#/components/schemas/ErrorInfo' not in ref:
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Error Responses",
-                    f"Error response {status_code} should reference ErrorInfo schema",
-                    f"{operation_name}.responses.{status_code}"
-                ))
+        for code in _ERROR_CODES:
+            # Single lookup per code; iterating the tuple keeps issue order stable
+            response = responses.get(code)
+            if isinstance(response, dict):
+                self._validate_error_response(response, code, operation_name, result)
 
     def _validate_error_response(self, response: dict, status_code: str, operation_name: str, result: ValidationResult):
         """Validate error response structure with $ref resolution"""
         
-        # Handle $ref in response
-        if '$ref' in response:
-            ref_path = response['$ref']
-            resolved_response = self._resolve_reference(ref_path, self.api_spec)
-            if resolved_response:
-                # Recursively validate the resolved response
-                self._validate_error_response(resolved_response, status_code, operation_name, result)
+        # Follow $ref chains in the response; a reference seen twice is a cycle
+        seen_refs = set()
+        ref_path = response.get('$ref')
+        while ref_path is not None:
+            if ref_path in seen_refs:
+                self._add_issue(
+                    result, Severity.CRITICAL, "Error Responses",
+                    f"Circular response reference: {ref_path}",
+                    f"{operation_name}.responses.{status_code}"
+                )
                 return
-            else:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Error Responses",
+            seen_refs.add(ref_path)
+            
+            resolved_response = self._resolve_reference(ref_path, self.api_spec)
+            if not resolved_response:
+                self._add_issue(
+                    result, Severity.CRITICAL, "Error Responses",
                     f"Cannot resolve response reference: {ref_path}",
                     f"{operation_name}.responses.{status_code}"
-                ))
+                )
                 return
+            response = resolved_response
+            ref_path = response.get('$ref')
         
         content = response.get('content', {})
         
         # Check for application/json content type
-        if 'application/json' not in content:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Error Responses",
+        json_content = content.get('application/json')
+        if json_content is None:
+            self._add_issue(
+                result, Severity.MEDIUM, "Error Responses",
                 f"Error response {status_code} should have application/json content",
                 f"{operation_name}.responses.{status_code}"
-            ))
+            )
             return
         
         # Check for ErrorInfo schema reference
-        json_content = content.get('application/json', {})
         schema = json_content.get('schema', {})
         
         if isinstance(schema, dict):
+            ref = schema.get('$ref')
+            all_of_items = schema.get('allOf')
             # Handle schema with $ref
-            if '$ref' in schema:
-                ref = schema.get('$ref', '')
+            if ref is not None:
                 if '#/components/schemas/ErrorInfo' not in ref:
-                    result.issues.append(ValidationIssue(
-                        Severity.MEDIUM, "Error Responses",
+                    self._add_issue(
+                        result, Severity.MEDIUM, "Error Responses",
                         f"Error response {status_code} should reference ErrorInfo schema",
                         f"{operation_name}.responses.{status_code}"
-                    ))
+                    )
             # Handle schema with allOf containing ErrorInfo reference
-            elif 'allOf' in schema:
-                all_of_items = schema.get('allOf', [])
-                has_error_info = False
-                for item in all_of_items:
-                    if isinstance(item, dict) and '$ref' in item:
-                        if '#/components/schemas/ErrorInfo' in item['$ref']:
-                            has_error_info = True
-                            break
+            elif all_of_items is not None:
+                has_error_info = any(
+                    isinstance(item, dict) and '#/components/schemas/ErrorInfo' in (item.get('$ref') or '')
+                    for item in all_of_items
+                )
                 
                 if not has_error_info:
-                    result.issues.append(ValidationIssue(
-                        Severity.MEDIUM, "Error Responses",
+                    self._add_issue(
+                        result, Severity.MEDIUM, "Error Responses",
                         f"Error response {status_code} should reference ErrorInfo schema",
                         f"{operation_name}.responses.{status_code}"
-                    ))
+                    )
             else:
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Error Responses",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Error Responses",
                     f"Error response {status_code} should reference ErrorInfo schema",
                     f"{operation_name}.responses.{status_code}"
-                ))
+                )
 
     def _validate_components(self, api_spec: dict, result: ValidationResult):
         """Validate components section"""
@@ -868,10 +1084,10 @@ class CAMARAAPIValidator:
         
         components = api_spec.get('components', {})
         if not components:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Components",
+            self._add_issue(
+                result, Severity.MEDIUM, "Components",
                 "No components defined"
-            ))
+            )
             return
         
         # Store api_spec reference for cross-method validation
@@ -892,71 +1108,70 @@ class CAMARAAPIValidator:
         
         for schema_name in required_schemas:
             if schema_name not in schemas:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Components",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Components",
                     f"Missing required `{schema_name}` schema",
                     "components.schemas"
-                ))
+                )
         
         # Validate ErrorInfo schema structure if present
-        if 'ErrorInfo' in schemas:
-            self._validate_error_info_schema(schemas['ErrorInfo'], result)
+        error_info_schema = schemas.get('ErrorInfo')
+        if error_info_schema is not None:
+            self._validate_error_info_schema(error_info_schema, result)
         
         # Check for deprecated schemas
-        deprecated_patterns = ['IDENTIFIER_MISMATCH']
         for schema_name, schema_def in schemas.items():
             if isinstance(schema_def, dict):
                 # Check for deprecated error codes in enum values
-                if 'enum' in schema_def:
-                    enum_values = schema_def.get('enum', [])
-                    for deprecated in deprecated_patterns:
+                enum_values = schema_def.get('enum')
+                if enum_values:
+                    for deprecated in _DEPRECATED_ERROR_CODES:
                         if deprecated in enum_values:
-                            result.issues.append(ValidationIssue(
-                                Severity.CRITICAL, "Error Responses",
+                            self._add_issue(
+                                result, Severity.CRITICAL, "Error Responses",
                                 f"Forbidden error code `{deprecated}` found",
                                 f"components.schemas.{schema_name}",
                                 f"Remove `{deprecated}` from enum values"
-                            ))
+                            )
 
     def _validate_error_info_schema(self, error_info_schema: dict, result: ValidationResult):
         """Validate ErrorInfo schema structure for v0.6 compliance"""
         if not isinstance(error_info_schema, dict):
             return
         
-        required_properties = ['code', 'message']
         properties = error_info_schema.get('properties', {})
         
-        for prop in required_properties:
+        for prop in _ERRORINFO_REQUIRED_PROPERTIES:
             if prop not in properties:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "ErrorInfo Schema",
+                self._add_issue(
+                    result, Severity.CRITICAL, "ErrorInfo Schema",
                     f"Missing required property `{prop}`",
                     "components.schemas.ErrorInfo.properties"
-                ))
+                )
 
     def _validate_security_schemes_section(self, security_schemes: dict, result: ValidationResult):
         """Validate security schemes section"""
         # Use existing API type detection
-        api_type = self._detect_api_type(self.api_spec)
-        is_subscription_api = api_type in [APIType.IMPLICIT_SUBSCRIPTION, APIType.EXPLICIT_SUBSCRIPTION]
+        api_type = self._get_api_type(self.api_spec)
+        is_subscription_api = api_type in _SUBSCRIPTION_API_TYPES
         
         # Check for required openId scheme
         if 'openId' not in security_schemes:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Security Schemes",
+            self._add_issue(
+                result, Severity.CRITICAL, "Security Schemes",
                 "Missing required 'openId' security scheme",
                 "components.securitySchemes",
                 "Add openId scheme with type: openIdConnect"
-            ))
+            )
         
         # For subscription APIs, check for notificationsBearerAuth
         if is_subscription_api and 'notificationsBearerAuth' not in security_schemes:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Security Schemes",
+            self._add_issue(
+                result, Severity.CRITICAL, "Security Schemes",
                 "Subscription APIs must include 'notificationsBearerAuth' security scheme",
                 "components.securitySchemes",
                 "Add notificationsBearerAuth scheme for callback authentication"
-            ))
+            )
         
         for scheme_name, scheme_def in security_schemes.items():
             if isinstance(scheme_def, dict):
@@ -967,85 +1182,85 @@ class CAMARAAPIValidator:
                     
                     # Check naming convention
                     if scheme_name != 'openId':
-                        result.issues.append(ValidationIssue(
-                            Severity.MEDIUM, "Security Schemes",
+                        self._add_issue(
+                            result, Severity.MEDIUM, "Security Schemes",
                             f"OpenID Connect scheme should be named 'openId', found '{scheme_name}'",
                             f"components.securitySchemes.{scheme_name}"
-                        ))
+                        )
                 
                 elif scheme_type == 'http' and scheme_name == 'notificationsBearerAuth':
                     self._validate_notifications_bearer_auth_scheme(scheme_def, scheme_name, result)
                 
                 elif scheme_type == 'oauth2':
-                    result.issues.append(ValidationIssue(
-                        Severity.CRITICAL, "Security Schemes",
+                    self._add_issue(
+                        result, Severity.CRITICAL, "Security Schemes",
                         f"Use 'openIdConnect' type instead of 'oauth2' for scheme '{scheme_name}'",
                         f"components.securitySchemes.{scheme_name}.type",
                         "CAMARA requires OpenID Connect, not OAuth2"
-                    ))
+                    )
                 
-                elif scheme_type not in ['openIdConnect', 'http']:
-                    result.issues.append(ValidationIssue(
-                        Severity.MEDIUM, "Security Schemes",
+                elif scheme_type not in _ALLOWED_SCHEME_TYPES:
+                    self._add_issue(
+                        result, Severity.MEDIUM, "Security Schemes",
                         f"Unexpected security scheme type '{scheme_type}' for '{scheme_name}'",
                         f"components.securitySchemes.{scheme_name}.type"
-                    ))
+                    )
 
 
     def _validate_openid_connect_scheme(self, scheme_def: dict, scheme_name: str, result: ValidationResult):
         """Validate OpenID Connect security scheme"""
         # Check for required openIdConnectUrl
         if 'openIdConnectUrl' not in scheme_def:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Security Schemes",
+            self._add_issue(
+                result, Severity.CRITICAL, "Security Schemes",
                 f"OpenID Connect scheme `{scheme_name}` missing openIdConnectUrl",
                 f"components.securitySchemes.{scheme_name}.openIdConnectUrl"
-            ))
+            )
             return
         
         # Validate URL format
         connect_url = scheme_def.get('openIdConnectUrl', '')
         if not connect_url.startswith(('https://', 'http://')):
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Security Schemes",
+            self._add_issue(
+                result, Severity.MEDIUM, "Security Schemes",
                 f"OpenID Connect URL should use HTTPS: `{connect_url}`",
                 f"components.securitySchemes.{scheme_name}.openIdConnectUrl"
-            ))
+            )
         
         # Check for well-known endpoint pattern
         if '.well-known/openid-configuration' not in connect_url:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Security Schemes",
+            self._add_issue(
+                result, Severity.MEDIUM, "Security Schemes",
                 f"OpenID Connect URL should point to well-known configuration: `{connect_url}`",
                 f"components.securitySchemes.{scheme_name}.openIdConnectUrl"
-            ))
+            )
 
     def _validate_notifications_bearer_auth_scheme(self, scheme_def: dict, scheme_name: str, result: ValidationResult):
         """Validate notificationsBearerAuth security scheme for subscription APIs"""
         # Check type
         if scheme_def.get('type') != 'http':
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Security Schemes",
+            self._add_issue(
+                result, Severity.CRITICAL, "Security Schemes",
                 f"Notifications Bearer Auth scheme `{scheme_name}` must have type 'http'",
                 f"components.securitySchemes.{scheme_name}.type"
-            ))
+            )
         
         # Check scheme
         if scheme_def.get('scheme') != 'bearer':
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Security Schemes",
+            self._add_issue(
+                result, Severity.CRITICAL, "Security Schemes",
                 f"Notifications Bearer Auth scheme `{scheme_name}` must have scheme 'bearer'",
                 f"components.securitySchemes.{scheme_name}.scheme"
-            ))
+            )
         
         # Check bearerFormat (should reference sinkCredential)
         bearer_format = scheme_def.get('bearerFormat', '')
         if 'sinkCredential' not in bearer_format:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Security Schemes",
+            self._add_issue(
+                result, Severity.MEDIUM, "Security Schemes",
                 f"Notifications Bearer Auth scheme `{scheme_name}` should reference sinkCredential in bearerFormat",
                 f"components.securitySchemes.{scheme_name}.bearerFormat"
-            ))
+            )
 
     def _validate_operation_security(self, operation: dict, path: str, method: str, 
                                 api_name: str, result: ValidationResult):
@@ -1057,17 +1272,19 @@ class CAMARAAPIValidator:
         # Get security requirements
         security = operation.get('security', [])
         
-        # Check if this is a callback operation FIRST (applies to all API types)
-        is_callback = 'callbacks' in operation_name.lower() or 'notification' in operation_name.lower()
+        # Check if this is a callback operation FIRST (applies to all API types);
+        # the markers can only occur in the path part of the operation name
+        path_lower = path.lower()
+        is_callback = 'callbacks' in path_lower or 'notification' in path_lower
         
         if is_callback:
             # Callback operations MUST support notificationsBearerAuth and MAY have empty security
             if security is None:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Operation Security",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Operation Security",
                     f"Callback operation must have security requirements with notificationsBearerAuth: {operation_name}",
                     f"{operation_name}.security"
-                ))
+                )
             else:
                 has_notifications_bearer_auth = False
                 has_empty_security = False
@@ -1077,28 +1294,30 @@ class CAMARAAPIValidator:
                         if not security_req:  # Empty security object
                             has_empty_security = True
                         elif 'notificationsBearerAuth' in security_req:
+                            # Empty security only matters without notificationsBearerAuth
                             has_notifications_bearer_auth = True
+                            break
                 
                 # MUST have notificationsBearerAuth
                 if not has_notifications_bearer_auth:
-                    result.issues.append(ValidationIssue(
-                        Severity.CRITICAL, "Operation Security",
+                    self._add_issue(
+                        result, Severity.CRITICAL, "Operation Security",
                         f"Callback operation must include notificationsBearerAuth: {operation_name}",
                         f"{operation_name}.security",
                         "Add notificationsBearerAuth to security requirements"
-                    ))
+                    )
                 
                 # Validate that it's not ONLY empty security
                 if has_empty_security and not has_notifications_bearer_auth:
-                    result.issues.append(ValidationIssue(
-                        Severity.CRITICAL, "Operation Security",
+                    self._add_issue(
+                        result, Severity.CRITICAL, "Operation Security",
                         f"Callback operation cannot have only empty security, must include notificationsBearerAuth: {operation_name}",
                         f"{operation_name}.security"
-                    ))
+                    )
             return  # Done with callback validation
         
         # For non-callback operations, check API type
-        api_type = self._detect_api_type(self.api_spec, api_name)
+        api_type = self._get_api_type(self.api_spec)
         
         # For explicit subscription APIs, use special validation
         if api_type == APIType.EXPLICIT_SUBSCRIPTION:
@@ -1117,20 +1336,20 @@ class CAMARAAPIValidator:
                     scopes = security_req['openId']
                     if isinstance(scopes, list):
                         for scope_name in scopes:
-                            if not re.match(r'^[a-z0-9-]+:[a-z0-9-]+(?::[a-z0-9-]+)?$', scope_name):
-                                result.issues.append(ValidationIssue(
-                                    Severity.MEDIUM, "Scope Naming",
+                            if not _SCOPE_RE.match(scope_name):
+                                self._add_issue(
+                                    result, Severity.MEDIUM, "Scope Naming",
                                     f"Scope name should follow pattern `api-name:[resource:]action`: `{scope_name}`",
                                     f"{operation_name}.security"
-                                ))
+                                )
                     break
             
             if not has_openid:
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Operation Security",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Operation Security",
                     f"Operation should use 'openId' security scheme: {operation_name}",
                     f"{operation_name}.security"
-                ))
+                )
 
     def _validate_explicit_subscription_scopes(self, operation: dict, path: str, method: str, 
                                             api_name: str, result: ValidationResult):
@@ -1155,32 +1374,32 @@ class CAMARAAPIValidator:
                     if method.lower() == 'post' and path.endswith('/subscriptions'):
                         # CREATE operation - should have event type in scope
                         if not self._is_valid_event_subscription_create_scope(scope, api_name):
-                            result.issues.append(ValidationIssue(
-                                Severity.MEDIUM, "Scope Naming",
+                            self._add_issue(
+                                result, Severity.MEDIUM, "Scope Naming",
                                 f"Event subscription creation scope should follow pattern `api-name:event-type:create`: `{scope}`",
                                 f"{method.upper()} {path}.security",
                                 "Use format: api-name:org.camaraproject.api-name.version.event-name:create"
-                            ))
+                            )
                     
                     elif method.lower() == 'get':
                         # READ operation
                         expected_scope = f"{api_name}:read"
                         if scope != expected_scope:
-                            result.issues.append(ValidationIssue(
-                                Severity.MEDIUM, "Scope Naming",
+                            self._add_issue(
+                                result, Severity.MEDIUM, "Scope Naming",
                                 f"Event subscription read scope should be `{expected_scope}`, found: `{scope}`",
                                 f"{method.upper()} {path}.security"
-                            ))
+                            )
                     
                     elif method.lower() == 'delete':
                         # DELETE operation
                         expected_scope = f"{api_name}:delete"
                         if scope != expected_scope:
-                            result.issues.append(ValidationIssue(
-                                Severity.MEDIUM, "Scope Naming",
+                            self._add_issue(
+                                result, Severity.MEDIUM, "Scope Naming",
                                 f"Event subscription delete scope should be `{expected_scope}`, found: `{scope}`",
                                 f"{method.upper()} {path}.security"
-                            ))
+                            )
 
     def _is_valid_event_subscription_create_scope(self, scope: str, api_name: str) -> bool:
         """Check if a scope follows the event subscription create pattern
@@ -1250,63 +1469,49 @@ class CAMARAAPIValidator:
         # Check if security references exist in components
         for security_req in security:
             if isinstance(security_req, dict):
-                for scheme_name in security_req.keys():
+                for scheme_name in security_req:
                     if scheme_name not in security_schemes:
-                        result.issues.append(ValidationIssue(
-                            Severity.CRITICAL, "Security Schemes",
+                        self._add_issue(
+                            result, Severity.CRITICAL, "Security Schemes",
                             f"Undefined security scheme `{scheme_name}` referenced",
                             "security",
                             f"Define `{scheme_name}` in components.securitySchemes"
-                        ))
+                        )
 
     def _check_scope_naming_patterns(self, api_spec: dict, result: ValidationResult):
         """Check scope naming patterns for consistency"""
         
         # Skip this check entirely for explicit subscription APIs
         # They have their own validation in _validate_operation_security
-        api_type = self._detect_api_type(api_spec)
+        api_type = self._get_api_type(api_spec)
         if api_type == APIType.EXPLICIT_SUBSCRIPTION:
             return
         
         result.checks_performed.append("Scope naming pattern validation")
         
-        components = api_spec.get('components', {})
-        security_schemes = components.get('securitySchemes', {})
-        
-        for scheme_name, scheme_def in security_schemes.items():
-            if isinstance(scheme_def, dict):
-                scheme_type = scheme_def.get('type')
-                
-                if scheme_type == 'openIdConnect':
-                    # OpenID Connect doesn't define scopes in the scheme itself
-                    # Scope validation happens at operation level through security requirements
-                    continue
-                elif scheme_type == 'oauth2':
-                    # Direct OAuth2 schemes are not used in CAMARA (OpenID Connect is used instead)
-                    # This will be flagged as critical error in security schemes validation
-                    # Skip scope validation for OAuth2 schemes
-                    continue
-                # For other scheme types (like 'http' for notificationsBearerAuth), no scope validation needed
+        # Security schemes themselves carry no scopes to check: OpenID Connect scopes
+        # live in the operation security requirements, OAuth2 schemes are flagged by
+        # the security schemes validation, and 'http' schemes have no scopes.
         
         # Validate scopes at operation level instead
-        paths = api_spec.get('paths', {})
-        for path, path_obj in paths.items():
-            if isinstance(path_obj, dict):
-                for method, operation in path_obj.items():
-                    if method in ['get', 'post', 'put', 'delete', 'patch'] and isinstance(operation, dict):
-                        security = operation.get('security', [])
-                        for security_req in security:
-                            if isinstance(security_req, dict):
-                                for scheme_name, scopes in security_req.items():
-                                    if isinstance(scopes, list):
-                                        for scope_name in scopes:
-                                            # Check kebab-case pattern for scopes
-                                            if not re.match(r'^[a-z0-9-]+:[a-z0-9-]+(?::[a-z0-9-]+)?$', scope_name):
-                                                result.issues.append(ValidationIssue(
-                                                    Severity.MEDIUM, "Scope Naming",
-                                                    f"Scope name should follow pattern `api-name:[resource:]action`: `{scope_name}`",
-                                                    f"{method.upper()} {path}.security"
-                                                ))
+        # (bound once, the innermost loop runs per scope of every operation)
+        add_issue = self._add_issue
+        scope_match = _SCOPE_RE.match
+        for path, method, operation in self._operations_of(api_spec):
+            if method in _CORE_HTTP_METHODS:
+                security = operation.get('security', [])
+                for security_req in security:
+                    if isinstance(security_req, dict):
+                        for scheme_name, scopes in security_req.items():
+                            if isinstance(scopes, list):
+                                for scope_name in scopes:
+                                    # Check kebab-case pattern for scopes
+                                    if not scope_match(scope_name):
+                                        add_issue(
+                                            result, Severity.MEDIUM, "Scope Naming",
+                                            f"Scope name should follow pattern `api-name:[resource:]action`: `{scope_name}`",
+                                            f"{method.upper()} {path}.security"
+                                        )
 
     def _extract_api_name_from_servers(self, api_spec: dict) -> Optional[str]:
         """Extract api-name from servers[*].url property
@@ -1330,7 +1535,7 @@ class CAMARAAPIValidator:
             # Remove {apiRoot} prefix if present
             if url.startswith('{apiRoot}/'):
                 path = url[10:]  # Remove '{apiRoot}/'
-            elif url.startswith('http://') or url.startswith('https://'):
+            elif url.startswith(('http://', 'https://')):
                 # Extract path from full URL
                 parsed = urlparse(url)
                 path = parsed.path.lstrip('/')
@@ -1338,26 +1543,25 @@ class CAMARAAPIValidator:
                 # Assume it's just the path part
                 path = url.lstrip('/')
             
-            # Split path components
-            path_parts = [part for part in path.split('/') if part]
+            # Only the first path component and whether another one follows matter
+            api_name, _, rest = path.lstrip('/').partition('/')
             
-            if len(path_parts) >= 2:
+            if not api_name:
+                continue
+            if rest.strip('/'):
                 # Format: <api-name>/<api-version>
-                api_name = path_parts[0]
                 api_names.add(api_name)
-            elif len(path_parts) == 1:
-                # Only one component - could be api-name without version
-                api_name = path_parts[0]
-                # Check if it looks like a version (starts with 'v' followed by numbers/dots)
-                if not re.match(r'^v\d+', api_name):
-                    api_names.add(api_name)
+            # Only one component - could be api-name without version
+            # Check if it looks like a version (starts with 'v' followed by numbers/dots)
+            elif not _VERSION_SEGMENT_RE.match(api_name):
+                api_names.add(api_name)
         
         # All servers should have the same api-name
         if len(api_names) == 1:
             return api_names.pop()
         elif len(api_names) > 1:
             # Multiple different api-names found - this is an error but return the first one
-            return sorted(api_names)[0]
+            return min(api_names)
         else:
             return None
 
@@ -1365,16 +1569,16 @@ class CAMARAAPIValidator:
         """Check filename consistency with API content"""
         result.checks_performed.append("Filename consistency validation")
         
-        filename = Path(file_path).stem
+        filename = os.path.splitext(os.path.basename(file_path))[0]
         
         # Check kebab-case
-        if not re.match(r'^[a-z0-9-]+$', filename):
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "File Naming",
+        if not _KEBAB_CASE_RE.match(filename):
+            self._add_issue(
+                result, Severity.CRITICAL, "File Naming",
                 f"Filename should use kebab-case: `{filename}`",
                 file_path,
                 "Use lowercase letters, numbers, and hyphens only"
-            ))
+            )
         
         # Extract api-name from servers URL (this is the correct reference)
         api_name = self._extract_api_name_from_servers(api_spec)
@@ -1382,12 +1586,12 @@ class CAMARAAPIValidator:
         if api_name:
             # Validate filename against api-name (primary check)
             if filename != api_name:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "File Naming",
+                self._add_issue(
+                    result, Severity.CRITICAL, "File Naming",
                     f"Filename `{filename}` doesn't match api-name `{api_name}` from servers URL",
                     file_path,
                     f"Rename file to `{api_name}.yaml` to match the api-name from servers[*].url"
-                ))
+                )
             
             # Validate title consistency with api-name (additional check)
             info = api_spec.get('info', {})
@@ -1405,20 +1609,20 @@ class CAMARAAPIValidator:
                 # If title doesn't contain the key concepts from api-name, flag it
                 if (api_name_words not in title_lower and 
                     not any(word in title_lower for word in api_name.split('-') if len(word) > 3)):
-                    result.issues.append(ValidationIssue(
-                        Severity.LOW, "API Consistency",
+                    self._add_issue(
+                        result, Severity.LOW, "API Consistency",
                         f"API title `{title}` may not align with api-name `{api_name}`",
                         "info.title",
                         f"Consider if title should reference concepts from api-name `{api_name}`"
-                    ))
+                    )
         else:
             # If we can't extract api-name, fall back to basic validation
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Server Configuration",
+            self._add_issue(
+                result, Severity.MEDIUM, "Server Configuration",
                 "Cannot extract api-name from servers[*].url for filename validation",
                 "servers",
-                "Ensure servers[*].url follows format: {apiRoot}/<api-name>/<api-version>"
-            ))
+                _SERVER_URL_FIX
+            )
             
             # Still check against title as a fallback (but with lower severity)
             info = api_spec.get('info', {})
@@ -1426,15 +1630,15 @@ class CAMARAAPIValidator:
             
             if title:
                 # Convert title to potential filename format
-                title_as_filename = re.sub(r'[^a-z0-9]+', '-', title).strip('-')
+                title_as_filename = _NON_KEBAB_CHARS_RE.sub('-', title).strip('-')
                 
                 if title_as_filename and filename != title_as_filename:
-                    result.issues.append(ValidationIssue(
-                        Severity.INFO, "File Naming",
+                    self._add_issue(
+                        result, Severity.INFO, "File Naming",
                         f"Filename `{filename}` doesn't match title pattern `{title_as_filename}`",
                         file_path,
                         "Consider aligning filename with API title (as fallback when api-name unavailable)"
-                    ))
+                    )
 
     def _check_version_url_consistency(self, api_spec: dict, result: ValidationResult):
         """Check consistency between API version and server URL suffix"""
@@ -1456,30 +1660,30 @@ class CAMARAAPIValidator:
         if self.review_type == "wip":
             # For WIP reviews, expect "wip" version
             if version != 'wip':
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Version",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Version",
                     f"WIP review expects version `wip`, found: `{version}`",
                     "info.version",
                     "Use version `wip` for work-in-progress development"
-                ))
+                )
             
             # Check server URL should end with /vwip
             if not server_url.endswith('/vwip'):
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Server URL",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Server URL",
                     "WIP review expects server URL to end with `/vwip`",
                     "servers[0].url",
                     "Use `/vwip` suffix in server URL for work-in-progress development"
-                ))
+                )
         else:
             # For release-candidate and other reviews
             if version == 'wip':
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Version",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Version",
                     "Work-in-progress version `wip` cannot be released",
                     "info.version",
                     "Update to proper semantic version (e.g., `0.1.0-rc.1`)"
-                ))
+                )
             
             # Check server URL matches version type using helper
             expected_suffix = self._get_expected_url_suffix(version)
@@ -1487,80 +1691,64 @@ class CAMARAAPIValidator:
             if expected_suffix and not server_url.endswith(expected_suffix):
                 # Check for common mistakes
                 if server_url.endswith('/wip'):
-                    result.issues.append(ValidationIssue(
-                        Severity.CRITICAL, "Server URL",
+                    self._add_issue(
+                        result, Severity.CRITICAL, "Server URL",
                         f"Invalid work-in-progress URL suffix `/wip`",
                         "servers[0].url",
                         f"For version `{version}`, use `{expected_suffix}`"
-                    ))
+                    )
                 elif server_url.endswith('/vwip'):
-                    result.issues.append(ValidationIssue(
-                        Severity.CRITICAL, "Server URL",
+                    self._add_issue(
+                        result, Severity.CRITICAL, "Server URL",
                         f"Version `{version}` cannot use work-in-progress URL suffix `/vwip`",
                         "servers[0].url",
                         f"Update server URL to end with `{expected_suffix}`"
-                    ))
+                    )
                 else:
-                    result.issues.append(ValidationIssue(
-                        Severity.CRITICAL, "Server URL",
+                    self._add_issue(
+                        result, Severity.CRITICAL, "Server URL",
                         f"Server URL version `{url_version}` doesn't match API version `{version}`",
                         "servers[0].url",
                         f"Update server URL to end with `{expected_suffix}`"
-                    ))
+                    )
 
     def _check_updated_generic401(self, api_spec: dict, result: ValidationResult):
         """Check for updated generic 401 error handling in Commonalities 0.6"""
         result.checks_performed.append("Generic 401 error validation (v0.6)")
         
-        # Look for 401 responses and check their structure
-        paths = api_spec.get('paths', {})
-        found_401_responses = []
-        
-        for path, path_obj in paths.items():
-            if isinstance(path_obj, dict):
-                for method, operation in path_obj.items():
-                    if method in ['get', 'post', 'put', 'delete', 'patch'] and isinstance(operation, dict):
-                        responses = operation.get('responses', {})
-                        if '401' in responses:
-                            found_401_responses.append(f"{method.upper()} {path}")
-        
         # Check components for UNAUTHENTICATED error code
         components = api_spec.get('components', {})
         schemas = components.get('schemas', {})
         
         for schema_name, schema_def in schemas.items():
-            if isinstance(schema_def, dict) and 'enum' in schema_def:
-                enum_values = schema_def.get('enum', [])
-                # Check for old pattern (should be UNAUTHENTICATED, not AUTHENTICATION_REQUIRED)
-                if 'AUTHENTICATION_REQUIRED' in enum_values:
-                    result.issues.append(ValidationIssue(
-                        Severity.MEDIUM, "Error Codes",
-                        "Use `UNAUTHENTICATED` instead of `AUTHENTICATION_REQUIRED`",
-                        f"components.schemas.{schema_name}",
-                        "Replace `AUTHENTICATION_REQUIRED` with `UNAUTHENTICATED`"
-                    ))
+            enum_values = schema_def.get('enum') if isinstance(schema_def, dict) else None
+            # Check for old pattern (should be UNAUTHENTICATED, not AUTHENTICATION_REQUIRED)
+            if enum_values and 'AUTHENTICATION_REQUIRED' in enum_values:
+                self._add_issue(
+                    result, Severity.MEDIUM, "Error Codes",
+                    "Use `UNAUTHENTICATED` instead of `AUTHENTICATION_REQUIRED`",
+                    f"components.schemas.{schema_name}",
+                    "Replace `AUTHENTICATION_REQUIRED` with `UNAUTHENTICATED`"
+                )
 
     def _check_mandatory_error_responses(self, api_spec: dict, result: ValidationResult):
         """Check for mandatory error responses"""
         result.checks_performed.append("Mandatory error responses validation")
         
-        paths = api_spec.get('paths', {})
-        
-        for path, path_obj in paths.items():
-            if isinstance(path_obj, dict):
-                for method, operation in path_obj.items():
-                    if method in ['get', 'post', 'put', 'delete', 'patch'] and isinstance(operation, dict):
-                        responses = operation.get('responses', {})
-                        operation_name = f"{method.upper()} {path}"
-                        
-                        # Check for mandatory 400 (Bad Request)
-                        if '400' not in responses:
-                            result.issues.append(ValidationIssue(
-                                Severity.MEDIUM, "Error Responses",
-                                "Missing 400 (Bad Request) response",
-                                f"{operation_name}.responses",
-                                "Add 400 response for validation errors"
-                            ))
+        add_issue = self._add_issue
+        for path, method, operation in self._operations_of(api_spec):
+            if method in _CORE_HTTP_METHODS:
+                responses = operation.get('responses', {})
+                
+                # Check for mandatory 400 (Bad Request)
+                if '400' not in responses:
+                    operation_name = f"{method.upper()} {path}"
+                    add_issue(
+                        result, Severity.MEDIUM, "Error Responses",
+                        "Missing 400 (Bad Request) response",
+                        f"{operation_name}.responses",
+                        "Add 400 response for validation errors"
+                    )
 
     def _check_server_url_format(self, api_spec: dict, result: ValidationResult):
         """Check server URL format compliance"""
@@ -1571,12 +1759,12 @@ class CAMARAAPIValidator:
             if isinstance(server, dict):
                 url = server.get('url', '')
                 if url and not url.startswith(('{apiRoot}', 'https://')):
-                    result.issues.append(ValidationIssue(
-                        Severity.MEDIUM, "Server URL",
+                    self._add_issue(
+                        result, Severity.MEDIUM, "Server URL",
                         f"Server URL should use HTTPS or template variable: `{url}`",
                         f"servers[{i}].url",
                         "Use `{apiRoot}` template or HTTPS URL"
-                    ))
+                    )
 
     def _check_commonalities_schema_compliance(self, api_spec: dict, result: ValidationResult):
         """Check compliance with Commonalities schema requirements"""
@@ -1594,100 +1782,92 @@ class CAMARAAPIValidator:
                 pattern = schema.get('pattern')
                 
                 # Check for updated XCorrelator pattern in v0.6
-                expected_pattern = r'^\w{8}-\w{4}-4\w{3}-[89aAbB]\w{3}-\w{12}$'
+                expected_pattern = _XCORRELATOR_PATTERN
                 if pattern != expected_pattern:
-                    result.issues.append(ValidationIssue(
-                        Severity.MEDIUM, "XCorrelator Pattern",
+                    self._add_issue(
+                        result, Severity.MEDIUM, "XCorrelator Pattern",
                         "XCorrelator pattern should follow Commonalities 0.6 specification",
                         "components.parameters.X-Correlator.schema.pattern",
                         f"Use pattern: `{expected_pattern}`"
-                    ))
+                    )
 
     def _check_event_subscription_compliance(self, api_spec: dict, result: ValidationResult):
         """Check event subscription compliance"""
         result.checks_performed.append("Event subscription compliance validation")
         
         # This check is API-type aware
-        if hasattr(self, '_current_api_type'):
-            api_type = self._current_api_type
-        else:
-            api_type = self._detect_api_type(api_spec)
+        api_type = self._get_api_type(api_spec)
         
-        if api_type in [APIType.EXPLICIT_SUBSCRIPTION, APIType.IMPLICIT_SUBSCRIPTION]:
+        if api_type in _SUBSCRIPTION_API_TYPES:
             # Check for event-related schemas
             components = api_spec.get('components', {})
             schemas = components.get('schemas', {})
             
-            event_schemas_found = any('event' in name.lower() for name in schemas.keys())
-            subscription_schemas_found = any('subscription' in name.lower() for name in schemas.keys())
+            # Lowercase all schema names in one go; the newline separator keeps
+            # keyword matches from spanning two names
+            schema_names_lower = '\n'.join(schemas).lower()
+            event_schemas_found = 'event' in schema_names_lower
+            subscription_schemas_found = 'subscription' in schema_names_lower
             
             if api_type == APIType.EXPLICIT_SUBSCRIPTION and not subscription_schemas_found:
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Subscription Schemas",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Subscription Schemas",
                     "Explicit subscription API should define subscription-related schemas",
                     "components.schemas",
                     "Add schemas for subscription management"
-                ))
+                )
             
             if not event_schemas_found:
-                result.issues.append(ValidationIssue(
-                    Severity.LOW, "Event Schemas",
+                self._add_issue(
+                    result, Severity.LOW, "Event Schemas",
                     "Subscription API should define event-related schemas",
                     "components.schemas",
                     "Consider adding event payload schemas"
-                ))
+                )
 
     def _check_explicit_subscription_compliance(self, api_spec: dict, result: ValidationResult):
         """Check explicit subscription API compliance"""
         result.checks_performed.append("Explicit subscription API compliance validation")
         
         paths = api_spec.get('paths', {})
-        subscription_paths = [path for path in paths.keys() if 'subscription' in path.lower()]
+        subscription_paths = [path for path in paths if 'subscription' in path.lower()]
         
         if not subscription_paths:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Subscription Endpoints",
+            self._add_issue(
+                result, Severity.CRITICAL, "Subscription Endpoints",
                 "Explicit subscription API must have subscription endpoints",
                 "paths",
                 "Add /subscriptions endpoints for CRUD operations"
-            ))
+            )
             return
         
         # Check for CRUD operations on subscription endpoints
         for path in subscription_paths:
             path_obj = paths.get(path, {})
             if isinstance(path_obj, dict):
-                methods = [method for method in path_obj.keys() if method in ['get', 'post', 'put', 'delete']]
+                methods = [method for method in path_obj if method in _SUBSCRIPTION_CRUD_METHODS]
                 
                 if not methods:
-                    result.issues.append(ValidationIssue(
-                        Severity.MEDIUM, "Subscription Operations",
+                    self._add_issue(
+                        result, Severity.MEDIUM, "Subscription Operations",
                         f"Subscription path `{path}` has no operations defined",
                         f"paths.{path}"
-                    ))
+                    )
 
     def _check_implicit_subscription_compliance(self, api_spec: dict, result: ValidationResult):
         """Check implicit subscription API compliance"""
         result.checks_performed.append("Implicit subscription API compliance validation")
         
         # Check for callback definitions
-        paths = api_spec.get('paths', {})
-        has_callbacks = False
-        
-        for path_obj in paths.values():
-            if isinstance(path_obj, dict):
-                for operation in path_obj.values():
-                    if isinstance(operation, dict) and 'callbacks' in operation:
-                        has_callbacks = True
-                        break
+        has_callbacks = any('callbacks' in operation for _, _, operation in self._operations_of(api_spec))
         
         if not has_callbacks:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Implicit Subscription",
+            self._add_issue(
+                result, Severity.MEDIUM, "Implicit Subscription",
                 "Implicit subscription API should define callbacks",
                 "paths",
                 "Add callback definitions for event notifications"
-            ))
+            )
 
     # ===========================================
     # Project Consistency and Test Validation
@@ -1705,30 +1885,27 @@ class CAMARAAPIValidator:
         specs = {}
         for api_file in api_files:
             try:
-                with open(api_file, 'r', encoding='utf-8') as f:
-                    specs[api_file] = yaml.safe_load(f)
+                specs[api_file] = load_api_spec(api_file)
             except Exception as e:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "File Loading",
+                self._add_issue(
+                    result, Severity.CRITICAL, "File Loading",
                     f"Failed to load `{api_file}`: {str(e)}",
                     api_file
-                ))
+                )
                 continue
         
         if len(specs) < 2:
             return result
             
-        # Define common schemas that should be identical
-        common_schema_names = [
-            'XCorrelator', 'ErrorInfo', 'Device', 'DeviceResponse', 
-            'PhoneNumber', 'NetworkAccessIdentifier', 'DeviceIpv4Addr', 
-            'DeviceIpv6Address', 'SingleIpv4Addr', 'Port', 'Point', 
-            'Latitude', 'Longitude', 'Area', 'AreaType', 'Circle'
-        ]
+        # Look up each file's schemas once for all shared schema checks
+        spec_schemas = {
+            file_path: spec.get('components', {}).get('schemas', {})
+            for file_path, spec in specs.items()
+        }
         
         # Check each common schema
-        for schema_name in common_schema_names:
-            self._validate_shared_schema(schema_name, specs, result)
+        for schema_name in _SHARED_SCHEMA_NAMES:
+            self._validate_shared_schema(schema_name, spec_schemas, result)
         
         # Check license consistency
         self._validate_license_consistency(specs, result)
@@ -1738,15 +1915,16 @@ class CAMARAAPIValidator:
         
         return result
 
-    def _validate_shared_schema(self, schema_name: str, specs: dict, result: ConsistencyResult):
-        """Validate that a shared schema is consistent across files"""
-        schemas_found = {}
+    def _validate_shared_schema(self, schema_name: str, spec_schemas: dict, result: ConsistencyResult):
+        """Validate that a shared schema is consistent across files
         
-        for file_path, spec in specs.items():
-            components = spec.get('components', {})
-            schemas = components.get('schemas', {})
-            if schema_name in schemas:
-                schemas_found[file_path] = schemas[schema_name]
+        spec_schemas maps each file path to its components.schemas mapping.
+        """
+        schemas_found = {
+            file_path: schemas[schema_name]
+            for file_path, schemas in spec_schemas.items()
+            if schema_name in schemas
+        }
         
         if len(schemas_found) < 2:
             return
@@ -1754,29 +1932,50 @@ class CAMARAAPIValidator:
         # Compare schemas (allowing for differences in examples and descriptions)
         file_paths = list(schemas_found.keys())
         reference_file = file_paths[0]
-        reference_schema = self._normalize_schema_for_comparison(schemas_found[reference_file])
+        reference_raw = schemas_found[reference_file]
+        reference_schema = None  # Normalized lazily, only if some copy differs verbatim
         
         for file_path in file_paths[1:]:
+            # Shared schemas are usually copied verbatim, which needs no normalization
+            if schemas_found[file_path] == reference_raw:
+                continue
+            
+            if reference_schema is None:
+                reference_schema = self._normalize_schema_for_comparison(reference_raw)
             current_schema = self._normalize_schema_for_comparison(schemas_found[file_path])
             
             if current_schema != reference_schema:
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Schema Consistency",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Schema Consistency",
                     f"Schema `{schema_name}` differs between files",
-                    f"{Path(reference_file).name} vs {Path(file_path).name}",
+                    f"{os.path.basename(reference_file)} vs {os.path.basename(file_path)}",
                     f"Ensure `{schema_name}` schema is identical across all files"
-                ))
+                )
 
     def _normalize_schema_for_comparison(self, schema: Any) -> Any:
-        """Normalize schema for comparison by removing examples and descriptions"""
+        """Normalize schema for comparison by removing examples and descriptions
+        
+        Containers that need no change are returned as-is rather than copied.
+        """
         if isinstance(schema, dict):
-            normalized = {}
-            for key, value in schema.items():
-                if key not in ['example', 'examples', 'description']:
-                    normalized[key] = self._normalize_schema_for_comparison(value)
-            return normalized
+            normalized = None  # Only built once a key is dropped or a value changes
+            if not _SCHEMA_ANNOTATION_KEYS.isdisjoint(schema):
+                normalized = {}
+            for index, (key, value) in enumerate(schema.items()):
+                if key in _SCHEMA_ANNOTATION_KEYS:
+                    continue
+                normalized_value = self._normalize_schema_for_comparison(value)
+                if normalized is None and normalized_value is not value:
+                    # First change: copy the untouched entries seen so far
+                    normalized = dict(itertools.islice(schema.items(), index))
+                if normalized is not None:
+                    normalized[key] = normalized_value
+            return schema if normalized is None else normalized
         elif isinstance(schema, list):
-            return [self._normalize_schema_for_comparison(item) for item in schema]
+            normalized = [self._normalize_schema_for_comparison(item) for item in schema]
+            if any(new is not old for new, old in zip(normalized, schema)):
+                return normalized
+            return schema
         else:
             return schema
 
@@ -1800,12 +1999,12 @@ class CAMARAAPIValidator:
                 continue
                 
             if license_info != reference_license:
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "License Consistency",
+                self._add_issue(
+                    result, Severity.MEDIUM, "License Consistency",
                     "License information differs between files",
-                    f"{Path(reference_file).name} vs {Path(file_path).name}",
+                    f"{os.path.basename(reference_file)} vs {os.path.basename(file_path)}",
                     "Ensure all files have identical license information"
-                ))
+                )
 
     def _validate_commonalities_consistency(self, specs: dict, result: ConsistencyResult):
         """Check that commonalities version is consistent"""
@@ -1827,35 +2026,35 @@ class CAMARAAPIValidator:
                 continue
                 
             if version != reference_version:
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Commonalities Consistency",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Commonalities Consistency",
                     f"Commonalities version differs: `{reference_version}` vs `{version}`",
-                    f"{Path(reference_file).name} vs {Path(file_path).name}",
+                    f"{os.path.basename(reference_file)} vs {os.path.basename(file_path)}",
                     "Ensure all files use the same commonalities version"
-                ))
+                )
 
-    def map_and_validate_test_files_to_apis(self, api_files: List[str], test_dir: str) -> List[TestAlignmentResult]:
-        """Map test files to APIs and validate each pair"""
+    def map_and_validate_test_files_to_apis(self, api_files: List[str], test_dir: str,
+                                            max_workers: Optional[int] = None) -> List[TestAlignmentResult]:
+        """Map test files to APIs and validate each pair (in worker processes when several APIs)"""
         test_results = []
         
         # Extract all API names first
         all_api_names = []
         for api_file in api_files:
             try:
-                with open(api_file, 'r', encoding='utf-8') as f:
-                    api_spec = yaml.safe_load(f)
+                api_spec = load_api_spec(api_file)
                 
                 # Extract api-name from servers URL
                 api_name = self._extract_api_name_from_servers(api_spec)
                 
                 # Fallback to filename if servers extraction fails
                 if not api_name:
-                    api_name = Path(api_file).stem
+                    api_name = os.path.splitext(os.path.basename(api_file))[0]
                 
                 all_api_names.append(api_name)
             except Exception:
                 # If we can't load the API file, use filename as fallback
-                all_api_names.append(Path(api_file).stem)
+                all_api_names.append(os.path.splitext(os.path.basename(api_file))[0])
         
         # Find all test files
         test_path = Path(test_dir)
@@ -1864,64 +2063,68 @@ class CAMARAAPIValidator:
             for api_file in api_files:
                 result = TestAlignmentResult(api_file=api_file)
                 result.checks_performed.append("Test alignment validation")
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Test Directory",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Test Directory",
                     f"Test directory does not exist: {test_dir}",
                     test_dir
-                ))
+                )
                 test_results.append(result)
             return test_results
         
-        all_test_files = [f.stem for f in test_path.glob("*.feature")]
+        # Keep the globbed paths so assignments and orphans reuse them
+        test_file_paths = {f.stem: f for f in test_path.glob("*.feature")}
         
         # Simple assignment logic: test_file_stem -> api_name
+        # A test file belongs to the API whose name equals its stem or is the longest
+        # '<api-name>-' prefix of it, so only the stem itself and its prefixes ending
+        # before a '-' need to be looked up.
+        api_name_set = set(all_api_names)
         test_file_assignments = {}
         
-        for api_name in all_api_names:
-            for test_file_stem in all_test_files:
-                # Check for match (exact or prefix)
-                is_exact_match = (test_file_stem == api_name)
-                is_prefix_match = test_file_stem.startswith(f"{api_name}-")
-                
-                if is_exact_match or is_prefix_match:
-                    current_assignment = test_file_assignments.get(test_file_stem)
-                    
-                    if current_assignment is None:
-                        # No assignment yet - assign it
-                        test_file_assignments[test_file_stem] = api_name
-                    elif len(api_name) > len(current_assignment):
-                        # Longer prefix wins - reassign
-                        test_file_assignments[test_file_stem] = api_name
+        for test_file_stem in test_file_paths:
+            if test_file_stem in api_name_set:
+                test_file_assignments[test_file_stem] = test_file_stem
+                continue
+            
+            dash = test_file_stem.rfind('-')
+            while dash > 0:
+                prefix = test_file_stem[:dash]
+                if prefix in api_name_set:
+                    test_file_assignments[test_file_stem] = prefix
+                    break
+                dash = test_file_stem.rfind('-', 0, dash)
         
         # Create reverse mapping: api_name -> [test_file_paths]
         api_to_test_files = {api_name: [] for api_name in all_api_names}
         for test_file_stem, api_name in test_file_assignments.items():
-            test_file_path = str(test_path / f"{test_file_stem}.feature")
-            api_to_test_files[api_name].append(test_file_path)
+            api_to_test_files[api_name].append(str(test_file_paths[test_file_stem]))
         
         # Find orphan test files
-        orphan_test_files = []
-        for test_file_stem in all_test_files:
-            if test_file_stem not in test_file_assignments:
-                orphan_test_files.append(f"{test_file_stem}.feature")
+        orphan_test_files = [
+            test_file.name for test_file_stem, test_file in test_file_paths.items()
+            if test_file_stem not in test_file_assignments
+        ]
         
         # Validate each API with its assigned test files
-        for api_file in api_files:
-            api_name = all_api_names[api_files.index(api_file)]
-            assigned_test_files = api_to_test_files[api_name]
-            
-            result = self.validate_test_alignment_single(api_file, api_name, assigned_test_files)
-            test_results.append(result)
+        assigned_test_files = [api_to_test_files[api_name] for api_name in all_api_names]
+        executor = _start_process_pool(_worker_count(max_workers, len(api_files)))
+        if executor is None:
+            test_results.extend(map(self.validate_test_alignment_single,
+                                    api_files, all_api_names, assigned_test_files))
+        else:
+            with executor:
+                test_results.extend(executor.map(self.validate_test_alignment_single,
+                                                 api_files, all_api_names, assigned_test_files))
         
         # Report orphan test files as issues in the first API result
         if orphan_test_files and test_results:
             for orphan_file in orphan_test_files:
-                test_results[0].issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Orphan Test Files",
+                self._add_issue(
+                    test_results[0], Severity.MEDIUM, "Orphan Test Files",
                     f"Test file `{orphan_file}` does not match any API",
                     f"{test_dir}/{orphan_file}",
                     f"Rename to match an API: {', '.join(all_api_names)}"
-                ))
+                )
         
         return test_results
 
@@ -1933,14 +2136,13 @@ class CAMARAAPIValidator:
         
         # Load API spec
         try:
-            with open(api_file, 'r', encoding='utf-8') as f:
-                api_spec = yaml.safe_load(f)
+            api_spec = load_api_spec(api_file)
         except Exception as e:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "API Loading",
+            self._add_issue(
+                result, Severity.CRITICAL, "API Loading",
                 f"Failed to load API file: {str(e)}",
                 api_file
-            ))
+            )
             return result
         
         # Extract API info
@@ -1949,12 +2151,12 @@ class CAMARAAPIValidator:
         api_title = api_info.get('title', '')
         
         if not assigned_test_files:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Test Files",
+            self._add_issue(
+                result, Severity.CRITICAL, "Test Files",
                 f"No test files found for API `{api_name}`",
                 "test directory",
                 f"Create either `{api_name}.feature` or `{api_name}-<operationId>.feature` files"
-            ))
+            )
             return result
         
         # Extract operation IDs from API
@@ -1974,7 +2176,7 @@ class CAMARAAPIValidator:
         paths = api_spec.get('paths', {})
         for path, path_obj in paths.items():
             for method, operation in path_obj.items():
-                if method in ['get', 'post', 'put', 'delete', 'patch']:
+                if method in _CORE_HTTP_METHODS:
                     operation_id = operation.get('operationId')
                     if operation_id:
                         operation_ids.append(operation_id)
@@ -1988,14 +2190,15 @@ class CAMARAAPIValidator:
             with open(test_file, 'r', encoding='utf-8') as f:
                 content = f.read()
         except Exception as e:
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Test File Loading",
+            self._add_issue(
+                result, Severity.CRITICAL, "Test File Loading",
                 f"Failed to load test file: {str(e)}",
                 test_file
-            ))
+            )
             return
         
-        lines = content.split('\n')
+        # Only the first two lines are inspected, so don't split the whole file
+        first_lines = content.split('\n', 2)[:2]
     
         # Validate URLs in test files match expected API name and version format
         self._validate_test_file_urls(content, api_name, api_version, test_file, result)
@@ -2005,7 +2208,7 @@ class CAMARAAPIValidator:
         feature_line_number = None
         
         # Check first two lines for Feature line
-        for i, line in enumerate(lines[:2]):
+        for i, line in enumerate(first_lines):
             stripped_line = line.strip()
             if stripped_line.startswith('Feature:'):
                 feature_line = stripped_line
@@ -2014,44 +2217,48 @@ class CAMARAAPIValidator:
         
         if feature_line:
             if not self._validate_test_version_line(feature_line, api_version, api_title):
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Test Version",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Test Version",
                     f"Feature line doesn't mention API version `{api_version}`",
                     f"{test_file}:line {feature_line_number}",
                     f"Include version `{api_version}` in Feature line: {feature_line}"
-                ))
+                )
         else:
-            result.issues.append(ValidationIssue(
-                Severity.MEDIUM, "Test Structure",
+            self._add_issue(
+                result, Severity.MEDIUM, "Test Structure",
                 "No Feature line found in first two lines",
                 f"{test_file}:lines 1-2",
                 "Add Feature line with API name and version"
-            ))
+            )
         
         # Check operation IDs referenced in test
         test_operations = self._extract_test_operations(content)
+        # api_operations stays a list for the ordered suggestions below; membership
+        # goes through a set (a non-string operationId can never match a test reference)
+        known_operations = {op for op in api_operations if isinstance(op, str)}
         
         # Validate that test operations exist in API
         for test_op in test_operations:
-            if test_op not in api_operations:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Test Operation IDs",
+            if test_op not in known_operations:
+                self._add_issue(
+                    result, Severity.CRITICAL, "Test Operation IDs",
                     f"Test references unknown operation `{test_op}`",
                     test_file,
                     f"Use valid operation ID from: `{', '.join(api_operations)}`"
-                ))
+                )
         
         # For operation-specific test files, validate naming
-        test_filename = Path(test_file).stem
-        if test_filename.startswith(f"{api_name}-"):
-            expected_operation = test_filename.replace(f"{api_name}-", "")
-            if expected_operation not in api_operations:
-                result.issues.append(ValidationIssue(
-                    Severity.LOW, "Test File Naming",
+        test_filename = os.path.splitext(os.path.basename(test_file))[0]
+        name_prefix = api_name + "-"
+        if test_filename.startswith(name_prefix):
+            expected_operation = test_filename.replace(name_prefix, "")
+            if expected_operation not in known_operations:
+                self._add_issue(
+                    result, Severity.LOW, "Test File Naming",
                     f"Test file suggests operation `{expected_operation}` but it doesn't exist in API",
                     test_file,
                     f"Check if test file naming is as intended, consider to use valid operation from: `{', '.join(api_operations)}`"
-                ))
+                )
 
     def _validate_test_file_urls(self, content: str, api_name: str, api_version: str, test_file: str, result: TestAlignmentResult):
         """Validate that URLs in test files match the expected API name and version format"""
@@ -2069,24 +2276,22 @@ class CAMARAAPIValidator:
         #   - (vwip|wip|v\d+...) - captures version
         #   - (\/[^"\']*)?  - optionally captures rest of path
         # Captures: (api-name, version, rest-of-path)
-        url_pattern = r'["\'](?:\{[^}]+\}/)?/?([a-zA-Z0-9_-]+)\/(vwip|wip|v\d+(?:\.\d+)?(?:rc\d+|alpha\d+)?)(\/[^"\']*)?["\']'
-        matches = re.findall(url_pattern, content)
+        matches = _TEST_URL_RE.findall(content)
         
         if not matches:
             # No URLs found - this is a critical error for API test files
-            result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Test URLs",
+            self._add_issue(
+                result, Severity.CRITICAL, "Test URLs",
                 "No API resource URLs found in test file",
                 test_file,
                 f'Add resource URLs like: And the resource "/{api_name}/<version>/endpoint" or "{{apiRoot}}/{api_name}/<version>/endpoint"'
-            ))
+            )
             return
         
         # Also check for URLs without leading slash (for style recommendation)
         # This pattern specifically looks for URLs without template variables and without leading slash
         # We don't flag URLs with template variables as they're typically root-relative already
-        no_slash_pattern = r'["\'](?!\{[^}]+\}/)([a-zA-Z0-9_-]+\/(vwip|wip|v\d+(?:\.\d+)?(?:rc\d+|alpha\d+)?)(?:\/[^"\']*)?)["\']'
-        no_slash_matches = re.findall(no_slash_pattern, content)
+        no_slash_matches = _TEST_URL_NO_SLASH_RE.findall(content)
         
         # Process matches - each match is (api_name_part, version_part, rest_of_path)
         found_urls = [(match[0], match[1], match[2] if len(match) > 2 else '') for match in matches]
@@ -2100,46 +2305,46 @@ class CAMARAAPIValidator:
             
             # First check API name consistency
             if url_api_name != api_name:
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Test URLs",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Test URLs",
                     f"Test file uses incorrect API name `{url_api_name}` (should be `{api_name}`)",
                     f"{test_file}: URL '{full_url}'",
                     f"Update to use correct API name: `{api_name}`"
-                ))
+                )
             
             # Then check version suffix - but only if API name is correct and we have a valid expected suffix
             elif expected_suffix and url_version == 'wip':
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Test URLs",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Test URLs",
                     f"Test file uses invalid `/wip` suffix",
                     f"{test_file}: URL '{full_url}'",
                     f"Update to use `{expected_suffix}`"
-                ))
+                )
             elif expected_suffix and api_version != 'wip' and url_version == 'vwip':
-                result.issues.append(ValidationIssue(
-                    Severity.CRITICAL, "Test URLs",
+                self._add_issue(
+                    result, Severity.CRITICAL, "Test URLs",
                     f"Test file uses work-in-progress URL suffix `/vwip` for version `{api_version}`",
                     f"{test_file}: URL '{full_url}'",
                     f"Update to use `{expected_suffix}`"
-                ))
+                )
             elif expected_suffix and url_version != expected_suffix.lstrip('/'):
-                result.issues.append(ValidationIssue(
-                    Severity.MEDIUM, "Test URLs",
+                self._add_issue(
+                    result, Severity.MEDIUM, "Test URLs",
                     f"Test file URL version `/{url_version}` doesn't match API version `{api_version}`",
                     f"{test_file}: URL '{full_url}'",
                     f"Expected: `{expected_suffix}`"
-                ))
+                )
         
         # Report URLs without leading slash as low priority style issue
         if no_slash_matches:
             for url_match in no_slash_matches:
                 url_str = url_match[0] if isinstance(url_match, tuple) else url_match
-                result.issues.append(ValidationIssue(
-                    Severity.LOW, "Test URL Style",
+                self._add_issue(
+                    result, Severity.LOW, "Test URL Style",
                     f"Resource URL without leading slash: `\"{url_str}\"`",
                     test_file,
                     f"Consider using root-relative path with leading slash: `\"/{url_str}\"`"
-                ))
+                )
 
     def _validate_test_version_line(self, feature_line: str, api_version: str, api_title: str) -> bool:
         """Check if Feature line contains the API version"""
@@ -2149,8 +2354,7 @@ class CAMARAAPIValidator:
             return 'wip' in feature_lower or 'vwip' in feature_lower
         
         # Look for semantic version pattern in Feature line
-        version_pattern = r'v?\d+\.\d+\.\d+(?:-rc\.\d+|-alpha\.\d+)?'
-        found_versions = re.findall(version_pattern, feature_line)
+        found_versions = _TEST_VERSION_RE.findall(feature_line)
         
         # Check for both exact version and version with 'v' prefix
         return api_version in found_versions or f'v{api_version}' in found_versions
@@ -2158,8 +2362,7 @@ class CAMARAAPIValidator:
     def _extract_test_operations(self, content: str) -> List[str]:
         """Extract operation IDs referenced in test content"""
         # Look for patterns like 'request "operationId"'
-        operation_pattern = r'request\s+"([^"]+)"'
-        operations = re.findall(operation_pattern, content)
+        operations = _TEST_OPERATION_RE.findall(content)
         
         return list(set(operations))  # Remove duplicates
 
@@ -2171,17 +2374,83 @@ def find_api_files(directory: str) -> List[str]:
     if not api_dir.exists():
         return []
     
+    # Single directory pass; .yaml files are listed before .yml files
     yaml_files = []
-    for pattern in ['*.yaml', '*.yml']:
-        yaml_files.extend(api_dir.glob(pattern))
+    yml_files = []
+    with os.scandir(api_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.yaml') and entry.is_file():
+                yaml_files.append(str(api_dir / entry.name))
+            elif entry.name.endswith('.yml') and entry.is_file():
+                yml_files.append(str(api_dir / entry.name))
+    
+    return yaml_files + yml_files
+
+def _total_severity_counts(results: List[ValidationResult],
+                           consistency_result: Optional[ConsistencyResult] = None,
+                           test_results: Optional[List[TestAlignmentResult]] = None) -> Counter:
+    """Sum per-severity issue counts over API, consistency and test alignment results"""
+    totals = Counter()
+    for result in itertools.chain(results, [consistency_result] if consistency_result else [],
+                                  test_results or []):
+        totals.update(result.severity_counts())
+    return totals
+
+def format_issue_markdown(issue: ValidationIssue) -> str:
+    """Render an issue as a markdown block of the detailed report"""
+    location = f"- **Location**: `{issue.location}`\n" if issue.location else ""
+    fix = f"- **Fix**: {sanitize_report_content(issue.fix_suggestion)}\n" if issue.fix_suggestion else ""
+    return (f"**{issue.severity.value}**: {issue.category}\n"
+            f"- **Description**: {sanitize_report_content(issue.description)}\n"
+            f"{location}{fix}\n")
+
+def _report_header(commonalities_version: str, repo_name: str, issue_number: str) -> str:
+    """Title and metadata block at the top of the detailed report"""
+    header = (
+        "# CAMARA API Review Report\n\n"
+        f"**Generated**: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"**Commonalities Version**: {commonalities_version}\n"
+        "**Validator Implementation**: v0.6\n"
+    )
+    if repo_name:
+        header += f"**Repository**: {repo_name}\n"
+    if issue_number:
+        header += f"**Issue or PR Number**: {issue_number}\n"
     
-    return [str(f) for f in yaml_files]
+    # Add version warning if mismatch
+    if commonalities_version != "0.6":
+        header += (
+            "\n> ⚠️ **Note**: This validator implements Commonalities v0.6 compliance rules. "
+            f"The requested version {commonalities_version} validation is performed using v0.6 rules.\n"
+        )
+    return header
+
+def _write_no_api_summary(out_path: Path):
+    """Write the GitHub summary for a repository without API definition files"""
+    with open(out_path / "summary.md", "w", encoding="utf-8") as f:
+        f.write("❌ **No API definition files found**\n\n"
+                "Please ensure YAML files are located in `/code/API_definitions/`\n")
+
+def _write_empty_report(out_path: Path, report_filename: str, report_header: str):
+    """Write the report and summary when there is nothing to report on"""
+    with open(out_path / report_filename, "w", encoding="utf-8") as f:
+        f.write(report_header +
+                "\n## Executive Summary\n\n"
+                "- **APIs Reviewed**: 0\n"
+                "- **Critical Issues**: 0\n"
+                "- **Medium Issues**: 0\n"
+                "- **Low Issues**: 0\n"
+                "- **Multi-file Consistency**: ⏭️ Skipped (single file)\n"
+                "- **Test Alignment**: ⏭️ Skipped (no tests found)\n\n"
+                "## Individual API Analysis\n\n")
+    _write_no_api_summary(out_path)
 
 def generate_report(results: List[ValidationResult], output_dir: str, repo_name: str = "", issue_number: str = "", 
                    consistency_result: Optional[ConsistencyResult] = None, 
                    test_results: List[TestAlignmentResult] = None, commonalities_version: str = "0.6"):
     """Generate comprehensive report and summary with API type detection"""
     os.makedirs(output_dir, exist_ok=True)
+    out_path = Path(output_dir)
     
     # Generate unique filename with repository name and timestamp
     timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -2197,22 +2466,32 @@ def generate_report(results: List[ValidationResult], output_dir: str, repo_name:
         base_filename = f"api_review_v{version_clean}_{timestamp}"
 
     report_filename = safe_filename(f"{base_filename}.md")
+    report_header = _report_header(commonalities_version, repo_name, issue_number)
+    
+    if not results and not consistency_result and not test_results:
+        _write_empty_report(out_path, report_filename, report_header)
+        return report_filename
     
     # Calculate totals
-    total_critical = sum(r.critical_count for r in results)
-    total_medium = sum(r.medium_count for r in results)
-    total_low = sum(r.low_count for r in results)
+    totals = _total_severity_counts(results, consistency_result, test_results)
+    total_critical = totals[Severity.CRITICAL]
+    total_medium = totals[Severity.MEDIUM]
+    total_low = totals[Severity.LOW]
     
-    if consistency_result:
-        total_critical += len([i for i in consistency_result.issues if i.severity == Severity.CRITICAL])
-        total_medium += len([i for i in consistency_result.issues if i.severity == Severity.MEDIUM])
-        total_low += len([i for i in consistency_result.issues if i.severity == Severity.LOW])
+    # API names of the test results, used by both the report and the summary
+    test_api_names = [os.path.splitext(os.path.basename(test_result.api_file))[0]
+                      for test_result in test_results or ()]
     
+    # All issues by source (individual APIs, project consistency, tests); critical
+    # issues are picked out once for both the report and the summary
+    issue_sources = [(result.api_name, result.issues) for result in results]
+    if consistency_result:
+        issue_sources.append(("Project-wide", consistency_result.issues))
     if test_results:
-        for test_result in test_results:
-            total_critical += len([i for i in test_result.issues if i.severity == Severity.CRITICAL])
-            total_medium += len([i for i in test_result.issues if i.severity == Severity.MEDIUM])
-            total_low += len([i for i in test_result.issues if i.severity == Severity.LOW])
+        for test_result, api_name in zip(test_results, test_api_names):
+            issue_sources.append((f"{api_name} Tests", test_result.issues))
+    critical_issues = [(source_name, issue) for source_name, issues in issue_sources
+                       for issue in issues if issue.severity is Severity.CRITICAL]
     
     # Collect all checks performed and manual checks needed
     all_checks_performed = set()
@@ -2229,272 +2508,187 @@ def generate_report(results: List[ValidationResult], output_dir: str, repo_name:
         for test_result in test_results:
             all_checks_performed.update(test_result.checks_performed)
     
-    # Generate detailed report
-    with open(f"{output_dir}/{report_filename}", "w") as f:
-        f.write(f"# CAMARA API Review Report\n\n")
-        if repo_name:
-            f.write(f"**Repository**: {repo_name}\n")
-        if issue_number and issue_number != "0":
-            f.write(f"**Issue/PR**: #{issue_number}\n")
-        f.write(f"**Generated**: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC\n")
-        f.write(f"**Requested Commonalities Version**: {commonalities_version}\n")
-        f.write(f"**Validator Implementation**: v0.6\n")
-        
-        # Add version warning if mismatch
-        if commonalities_version != "0.6":
-            f.write(f"\n> ⚠️ **Note**: This validator implements Commonalities v0.6 compliance rules. ")
-            f.write(f"The requested version {commonalities_version} validation is performed using v0.6 rules.\n")
-        
-        f.write("\n---\n\n")
-
-    # Generate detailed report
-    with open(f"{output_dir}/{report_filename}", "w") as f:
-        f.write(f"# CAMARA API Review Report\n\n")
-        f.write(f"**Generated**: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"**Commonalities Version**: {commonalities_version}\n")
-        
-        if repo_name:
-            f.write(f"**Repository**: {repo_name}\n")
-        if issue_number:
-            f.write(f"**Issue or PR Number**: {issue_number}\n")
-        
-        f.write(f"\n## Executive Summary\n\n")
-        f.write(f"- **APIs Reviewed**: {len(results)}\n")
-        f.write(f"- **Critical Issues**: {total_critical}\n")
-        f.write(f"- **Medium Issues**: {total_medium}\n")
-        f.write(f"- **Low Issues**: {total_low}\n")
-        f.write(f"- **Multi-file Consistency**: {'✅ Checked' if consistency_result else '⏭️ Skipped (single file)'}\n")
-        f.write(f"- **Test Alignment**: {'✅ Checked' if test_results else '⏭️ Skipped (no tests found)'}\n\n")
-        
-        # API Type Summary
-        type_counts = {}
-        for result in results:
-            api_type = result.api_type.value
-            type_counts[api_type] = type_counts.get(api_type, 0) + 1
-        
-        if type_counts:
-            f.write("### API Types Detected\n\n")
-            for api_type, count in type_counts.items():
-                f.write(f"- **{api_type}**: {count}\n")
-            f.write("\n")
-        
-        # 1. INDIVIDUAL API RESULTS
-        f.write("## Individual API Analysis\n\n")
-        for result in results:
-            f.write(f"### `{result.api_name}` v{result.version}\n\n")
-            f.write(f"**File**: `{Path(result.file_path).name}`\n")
-            f.write(f"**Type**: {result.api_type.value}\n")
-            f.write(f"**Issues**: {result.critical_count} critical, {result.medium_count} medium, {result.low_count} low\n\n")
+    # Generate detailed report (assembled in memory and written in one call)
+    report_parts = []
+    w = report_parts.append
+    w(report_header)
+    w(f"\n## Executive Summary\n\n")
+    w(f"- **APIs Reviewed**: {len(results)}\n")
+    w(f"- **Critical Issues**: {total_critical}\n")
+    w(f"- **Medium Issues**: {total_medium}\n")
+    w(f"- **Low Issues**: {total_low}\n")
+    w(f"- **Multi-file Consistency**: {'✅ Checked' if consistency_result else '⏭️ Skipped (single file)'}\n")
+    w(f"- **Test Alignment**: {'✅ Checked' if test_results else '⏭️ Skipped (no tests found)'}\n\n")
+    
+    # API Type Summary
+    type_counts = Counter(result.api_type.value for result in results)
+    
+    if type_counts:
+        w("### API Types Detected\n\n")
+        for api_type, count in type_counts.items():
+            w(f"- **{api_type}**: {count}\n")
+        w("\n")
+    
+    # 1. INDIVIDUAL API RESULTS
+    w("## Individual API Analysis\n\n")
+    for result in results:
+        w(f"### `{result.api_name}` v{result.version}\n\n")
+        w(f"**File**: `{os.path.basename(result.file_path)}`\n")
+        w(f"**Type**: {result.api_type.value}\n")
+        counts = result.severity_counts()
+        w(f"**Issues**: {counts[Severity.CRITICAL]} critical, {counts[Severity.MEDIUM]} medium, {counts[Severity.LOW]} low\n\n")
+        
+        if result.issues:
+            w("#### Issues Found\n\n")
+            for issue in result.issues:
+                w(format_issue_markdown(issue))
+        else:
+            w("✅ **No issues found**\n\n")
+    
+    # 2. PROJECT CONSISTENCY RESULTS
+    if consistency_result and consistency_result.issues:
+        w("## Project-Wide Consistency Issues\n\n")
+        for issue in consistency_result.issues:
+            w(format_issue_markdown(issue))
+    
+    # 3. TEST ALIGNMENT RESULTS
+    if test_results:
+        w("## Test Alignment Analysis\n\n")
+        for test_result, api_name in zip(test_results, test_api_names):
+            w(f"### Tests for `{api_name}`\n\n")
             
-            if result.issues:
-                f.write("#### Issues Found\n\n")
-                for issue in result.issues:
-                    f.write(f"**{issue.severity.value}**: {issue.category}\n")
-                    f.write(f"- **Description**: {sanitize_report_content(issue.description)}\n")
-                    if issue.location:
-                        f.write(f"- **Location**: `{issue.location}`\n")
-                    if issue.fix_suggestion:
-                        f.write(f"- **Fix**: {sanitize_report_content(issue.fix_suggestion)}\n")
-                    f.write("\n")
+            if test_result.test_files:
+                w("**Test Files Found**:\n")
+                for test_file in test_result.test_files:
+                    w(f"- `{os.path.basename(test_file)}`\n")
+                w("\n")
             else:
-                f.write("✅ **No issues found**\n\n")
-        
-        # 2. PROJECT CONSISTENCY RESULTS
-        if consistency_result and consistency_result.issues:
-            f.write("## Project-Wide Consistency Issues\n\n")
-            for issue in consistency_result.issues:
-                f.write(f"**{issue.severity.value}**: {issue.category}\n")
-                f.write(f"- **Description**: {sanitize_report_content(issue.description)}\n")
-                if issue.location:
-                    f.write(f"- **Location**: `{issue.location}`\n")
-                if issue.fix_suggestion:
-                    f.write(f"- **Fix**: {sanitize_report_content(issue.fix_suggestion)}\n")
-                f.write("\n")
-        
-        # 3. TEST ALIGNMENT RESULTS
-        if test_results:
-            f.write("## Test Alignment Analysis\n\n")
-            for test_result in test_results:
-                api_name = Path(test_result.api_file).stem
-                f.write(f"### Tests for `{api_name}`\n\n")
-                
-                if test_result.test_files:
-                    f.write("**Test Files Found**:\n")
-                    for test_file in test_result.test_files:
-                        f.write(f"- `{Path(test_file).name}`\n")
-                    f.write("\n")
-                else:
-                    f.write("❌ **No test files found**\n\n")
-                
-                if test_result.issues:
-                    f.write("#### Test Issues\n\n")
-                    for issue in test_result.issues:
-                        f.write(f"**{issue.severity.value}**: {issue.category}\n")
-                        f.write(f"- **Description**: {sanitize_report_content(issue.description)}\n")
-                        if issue.location:
-                            f.write(f"- **Location**: `{issue.location}`\n")
-                        if issue.fix_suggestion:
-                            f.write(f"- **Fix**: {sanitize_report_content(issue.fix_suggestion)}\n")
-                        f.write("\n")
-        
-        # 4. CRITICAL ISSUES SUMMARY  
-        critical_issues = []
-        for result in results:
-            critical_issues.extend([i for i in result.issues if i.severity == Severity.CRITICAL])
-        
-        if consistency_result:
-            critical_issues.extend([i for i in consistency_result.issues if i.severity == Severity.CRITICAL])
-        
-        if test_results:
-            for test_result in test_results:
-                critical_issues.extend([i for i in test_result.issues if i.severity == Severity.CRITICAL])
-        
-        if critical_issues:
-            f.write("## Critical Issues Requiring Immediate Attention\n\n")
-            for issue in critical_issues[:10]:  # Limit to first 10
-                f.write(f"- **{issue.category}**: {sanitize_report_content(issue.description)}")
-                if issue.location:
-                    f.write(f" (`{issue.location}`)")
-                f.write("\n")
-            
-            if len(critical_issues) > 10:
-                f.write(f"\n*... and {len(critical_issues) - 10} more critical issues. See detailed report for complete analysis.*\n")
+                w("❌ **No test files found**\n\n")
             
-            f.write("\n")
-        
-        # 5. AUTOMATED CHECKS PERFORMED
-        if all_checks_performed:
-            f.write("## Automated Checks Performed\n\n")
-            for check in sorted(all_checks_performed):
-                f.write(f"- {check}\n")
-            f.write("\n")
-        
-        # 6. MANUAL REVIEW REQUIRED
-        if all_manual_checks:
-            f.write("## Manual Review Required\n\n")
-            for check in sorted(all_manual_checks):
-                f.write(f"- {check}\n")
-            f.write("\n")
-        
+            if test_result.issues:
+                w("#### Test Issues\n\n")
+                for issue in test_result.issues:
+                    w(format_issue_markdown(issue))
+    
+    # 4. CRITICAL ISSUES SUMMARY  
+    if critical_issues:
+        w("## Critical Issues Requiring Immediate Attention\n\n")
+        for _, issue in critical_issues[:10]:  # Limit to first 10
+            w(f"- **{issue.category}**: {sanitize_report_content(issue.description)}")
+            if issue.location:
+                w(f" (`{issue.location}`)")
+            w("\n")
+        
+        if len(critical_issues) > 10:
+            w(f"\n*... and {len(critical_issues) - 10} more critical issues. See detailed report for complete analysis.*\n")
+        
+        w("\n")
+    
+    # 5. AUTOMATED CHECKS PERFORMED
+    if all_checks_performed:
+        w("## Automated Checks Performed\n\n")
+        for check in sorted(all_checks_performed):
+            w(f"- {check}\n")
+        w("\n")
+    
+    # 6. MANUAL REVIEW REQUIRED
+    if all_manual_checks:
+        w("## Manual Review Required\n\n")
+        for check in sorted(all_manual_checks):
+            w(f"- {check}\n")
+        w("\n")
+    
+    with open(out_path / report_filename, "w", encoding="utf-8") as f:
+        f.write("".join(report_parts))
+    
     # Generate summary for GitHub comment with 25-item limit
-    with open(f"{output_dir}/summary.md", "w") as f:
-        if not results:
-            f.write("❌ **No API definition files found**\n\n")
-            f.write("Please ensure YAML files are located in `/code/API_definitions/`\n")
-            return report_filename
-
-        # No need for special sanitization - just ensure single lines
-        def sanitize_for_summary(text: str) -> str:
-            """Ensure text is on a single line"""
-            # Replace all whitespace (including newlines) with single spaces
-            return ' '.join(text.split())        
+    if not results:
+        _write_no_api_summary(out_path)
+        return report_filename
+    
+    summary_parts = []
+    w = summary_parts.append
+
+    # No need for special sanitization - just ensure single lines
+    def sanitize_for_summary(text: str) -> str:
+        """Ensure text is on a single line"""
+        # Replace all whitespace (including newlines) with single spaces
+        return ' '.join(text.split())        
    
-        # Overall status
-        if total_critical == 0:
-            if total_medium == 0:
-                status = "✅ **Ready for Release**"
-            else:
-                status = "⚠️ **Conditional Approval**"
-        else:
-            status = "❌ **Critical Issues Found**"
-        
-        f.write(f"### {status}\n\n")
-        
-        # APIs found with types
-        f.write("**APIs Reviewed**:\n")
-        for result in results:
-            type_indicator = {
-                APIType.EXPLICIT_SUBSCRIPTION: "🔔",
-                APIType.IMPLICIT_SUBSCRIPTION: "📧", 
-                APIType.REGULAR: "📄"
-            }.get(result.api_type, "📄")
-            
-            f.write(f"- {type_indicator} `{result.api_name}` v{result.version} ({result.api_type.value})\n")
-        f.write("\n")
-        
-        # Issue summary
-        f.write("**Issues Summary**:\n")
-        f.write(f"- 🔴 Critical: {total_critical}\n")
-        f.write(f"- 🟡 Medium: {total_medium}\n")
-        f.write(f"- 🔵 Low: {total_low}\n\n")
-        
-        # Enhanced issues detail with 25-item limit, prioritizing critical then medium
-        if total_critical > 0 or total_medium > 0:
-            f.write("**Issues Requiring Attention**:\n")
-            
-            # Collect all issues from all sources
-            all_critical_issues = []
-            all_medium_issues = []
-            
-            # From individual API results
-            for result in results:
-                critical_issues = [i for i in result.issues if i.severity == Severity.CRITICAL]
-                medium_issues = [i for i in result.issues if i.severity == Severity.MEDIUM]
-                
-                for issue in critical_issues:
-                    all_critical_issues.append((result.api_name, issue))
-                for issue in medium_issues:
-                    all_medium_issues.append((result.api_name, issue))
-            
-            # From consistency results
-            if consistency_result:
-                critical_issues = [i for i in consistency_result.issues if i.severity == Severity.CRITICAL]
-                medium_issues = [i for i in consistency_result.issues if i.severity == Severity.MEDIUM]
-                
-                for issue in critical_issues:
-                    all_critical_issues.append(("Project-wide", issue))
-                for issue in medium_issues:
-                    all_medium_issues.append(("Project-wide", issue))
-            
-            # From test results
-            if test_results:
-                for test_result in test_results:
-                    critical_issues = [i for i in test_result.issues if i.severity == Severity.CRITICAL]
-                    medium_issues = [i for i in test_result.issues if i.severity == Severity.MEDIUM]
-                    
-                    api_name = Path(test_result.api_file).stem
-                    for issue in critical_issues:
-                        all_critical_issues.append((f"{api_name} Tests", issue))
-                    for issue in medium_issues:
-                        all_medium_issues.append((f"{api_name} Tests", issue))
-            
-            # Show critical issues first (up to 20 to leave room for medium)
-            critical_to_show = min(len(all_critical_issues), 20)
-            
-            if critical_to_show > 0:
-                f.write(f"\n**🔴 Critical Issues ({critical_to_show}):**\n")
-                for source_name, issue in all_critical_issues[:critical_to_show]:
-                    description = sanitize_for_summary(issue.description)
-                    f.write(f"- *{source_name}*: **{issue.category}** - {description}\n")
-            
-            # Show medium issues if there's room
-            remaining_slots = 25 - critical_to_show
-            medium_to_show = min(len(all_medium_issues), remaining_slots)
-            
-            if medium_to_show > 0:
-                f.write(f"\n**🟡 Medium Priority Issues ({medium_to_show}):**\n")
-                for source_name, issue in all_medium_issues[:medium_to_show]:
-                    description = sanitize_for_summary(issue.description)
-                    f.write(f"- *{source_name}*: **{issue.category}** - {description}\n")
-            
-            # Note if there are more issues not shown
-            total_not_shown = (len(all_critical_issues) + len(all_medium_issues)) - 25
-            if total_not_shown > 0:
-                f.write(f"\n*Note: {total_not_shown} additional issues not shown above. See detailed report for complete analysis.*\n")
-            
-            f.write("\n")
-        
-        # Recommendation
-        if total_critical == 0 and total_medium == 0:
-            f.write("**Recommendation**: ✅ Approved for release\n")
-        elif total_critical == 0:
-            f.write("**Recommendation**: ⚠️ Approved with medium-priority improvements recommended\n")
+    # Overall status
+    if total_critical == 0:
+        if total_medium == 0:
+            status = "✅ **Ready for Release**"
         else:
-            f.write(f"**Recommendation**: ❌ Address {total_critical} critical issue(s) before release\n")
-        
-        f.write(f"\n📄 **Detailed Report**: {report_filename}\n")
-        f.write("\n📄 **Download**: Available as workflow artifact for complete analysis\n")
-        f.write("\n🔍 **Validation**: This review includes subscription type detection, scope validation, filename consistency, schema compliance, project consistency, and test alignment validation\n")
+            status = "⚠️ **Conditional Approval**"
+    else:
+        status = "❌ **Critical Issues Found**"
+    
+    w(f"### {status}\n\n")
+    
+    # APIs found with types
+    w("**APIs Reviewed**:\n")
+    for result in results:
+        type_indicator = _API_TYPE_INDICATORS.get(result.api_type, "📄")
+        w(f"- {type_indicator} `{result.api_name}` v{result.version} ({result.api_type.value})\n")
+    w("\n")
+    
+    # Issue summary
+    w("**Issues Summary**:\n")
+    w(f"- 🔴 Critical: {total_critical}\n")
+    w(f"- 🟡 Medium: {total_medium}\n")
+    w(f"- 🔵 Low: {total_low}\n\n")
+    
+    # Enhanced issues detail with 25-item limit, prioritizing critical then medium
+    if total_critical > 0 or total_medium > 0:
+        w("**Issues Requiring Attention**:\n")
+        
+        # Show critical issues first (up to 20 to leave room for medium)
+        shown_critical_issues = critical_issues[:20]
+        critical_to_show = len(shown_critical_issues)
+        
+        if critical_to_show > 0:
+            w(f"\n**🔴 Critical Issues ({critical_to_show}):**\n")
+            for source_name, issue in shown_critical_issues:
+                description = sanitize_for_summary(issue.description)
+                w(f"- *{source_name}*: **{issue.category}** - {description}\n")
+        
+        # Show medium issues if there's room
+        # Only the first 25 issues are listed, so medium issues are collected only up to
+        # the remaining slots; the totals above already count every issue
+        remaining_slots = 25 - critical_to_show
+        medium_issues = ((source_name, issue) for source_name, issues in issue_sources
+                         for issue in issues if issue.severity is Severity.MEDIUM)
+        shown_medium_issues = list(itertools.islice(medium_issues, remaining_slots))
+        medium_to_show = len(shown_medium_issues)
+        
+        if medium_to_show > 0:
+            w(f"\n**🟡 Medium Priority Issues ({medium_to_show}):**\n")
+            for source_name, issue in shown_medium_issues:
+                description = sanitize_for_summary(issue.description)
+                w(f"- *{source_name}*: **{issue.category}** - {description}\n")
+        
+        # Note if there are more issues not shown
+        total_not_shown = (total_critical + total_medium) - 25
+        if total_not_shown > 0:
+            w(f"\n*Note: {total_not_shown} additional issues not shown above. See detailed report for complete analysis.*\n")
+        
+        w("\n")
+    
+    # Recommendation
+    if total_critical == 0 and total_medium == 0:
+        w("**Recommendation**: ✅ Approved for release\n")
+    elif total_critical == 0:
+        w("**Recommendation**: ⚠️ Approved with medium-priority improvements recommended\n")
+    else:
+        w(f"**Recommendation**: ❌ Address {total_critical} critical issue(s) before release\n")
+    
+    w(f"\n📄 **Detailed Report**: {report_filename}\n")
+    w("\n📄 **Download**: Available as workflow artifact for complete analysis\n")
+    w("\n🔍 **Validation**: This review includes subscription type detection, scope validation, filename consistency, schema compliance, project consistency, and test alignment validation\n")
+    
+    with open(out_path / "summary.md", "w", encoding="utf-8") as f:
+        f.write("".join(summary_parts))
     
     # Return the report filename for use by the workflow
     return report_filename
@@ -2513,6 +2707,10 @@ def main():
     parser.add_argument('--issue-number', required=False, default='0', help='Issue or PR number for context')
     parser.add_argument('--commonalities-version', required=True, help='CAMARA Commonalities version')
     parser.add_argument('--review-type', required=True, help='Type of review (release-candidate, wip, public-release)')
+    parser.add_argument('--min-severity', choices=['info', 'low', 'medium', 'critical'], default='info',
+                        help='Only report issues of this severity or higher (default: info)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes for per-file validation (default: CPU count, 1 disables)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
     
     print("🔍 Debug: Argument parser created successfully")
@@ -2556,21 +2754,20 @@ def main():
         print(f"🔍 Debug: Commonalities version: '{commonalities_version}'")
         
         # Validate commonalities version format
-        if not re.match(r'^\d+\.\d+$', commonalities_version):
+        if not _COMMONALITIES_VERSION_RE.match(commonalities_version):
             print(f"❌ Invalid commonalities version format: '{commonalities_version}'")
             raise ValueError(f"Invalid commonalities version format: {commonalities_version}. Expected format: X.Y (e.g., 0.6)")
         
         print(f"✅ Debug: Commonalities version validation passed: {commonalities_version}")
         
         output_dir = args.output
-        repo_name = re.sub(r'[^a-zA-Z0-9_-]', '', args.repo_name)[:100]
-        issue_number = re.sub(r'[^0-9]', '', args.issue_number)[:20]
+        repo_name = _REPO_NAME_DROP_RE.sub('', args.repo_name)[:100]
+        issue_number = _NON_DIGIT_RE.sub('', args.issue_number)[:20]
         
         # Create output directory
         abs_output_dir = os.path.abspath(os.path.expanduser(output_dir))
-        if not os.path.exists(abs_output_dir):
-            print(f"🔍 Debug: Creating output directory: {abs_output_dir}")
-            os.makedirs(abs_output_dir, mode=0o755)
+        print(f"🔍 Debug: Output directory: {abs_output_dir}")
+        os.makedirs(abs_output_dir, mode=0o755, exist_ok=True)
         
         print("✅ Debug: All input validation passed!")
         
@@ -2598,7 +2795,7 @@ def main():
         print(f"Checked location: {repo_dir}/code/API_definitions/")
         print("📄 Creating empty results report...")
         try:
-            report_filename = generate_report([], output_dir, repo_name, issue_number, commonalities_version=commonalities_version)
+            report_filename = generate_report([], abs_output_dir, repo_name, issue_number, commonalities_version=commonalities_version)
             print(f"📄 Empty report generated: {report_filename}")
         except Exception as e:
             print(f"❌ Error generating empty report: {str(e)}")
@@ -2610,30 +2807,9 @@ def main():
             print(f"  - {file}")
     
     # Validate each file
-    validator = CAMARAAPIValidator(commonalities_version, args.review_type)
-    results = []
-    
-    for api_file in api_files:
-        if args.verbose:
-            print(f"\n📋 Validating {api_file}...")
-        try:
-            result = validator.validate_api_file(api_file)
-            results.append(result)
-            
-            if args.verbose:
-                print(f"  📄 API Type: {result.api_type.value}")
-                print(f"  🔴 Critical: {result.critical_count}")
-                print(f"  🟡 Medium: {result.medium_count}")
-                print(f"  🔵 Low: {result.low_count}")
-                
-        except Exception as e:
-            print(f"  ❌ Error validating {api_file}: {str(e)}")
-            # Create error result
-            error_result = ValidationResult(file_path=api_file)
-            error_result.issues.append(ValidationIssue(
-                Severity.CRITICAL, "Validation Error", f"Failed to validate file: {str(e)}"
-            ))
-            results.append(error_result)
+    validator = CAMARAAPIValidator(commonalities_version, args.review_type,
+                                   Severity[args.min_severity.upper()])
+    results = validator.validate_files(api_files, args.jobs, args.verbose)
     
     # Project-wide consistency validation
     consistency_result = None
@@ -2642,14 +2818,11 @@ def main():
             print(f"\n🔗 Performing project consistency validation...")
         try:
             consistency_result = validator.validate_project_consistency(api_files)
-            consistency_critical = len([i for i in consistency_result.issues if i.severity == Severity.CRITICAL])
-            consistency_medium = len([i for i in consistency_result.issues if i.severity == Severity.MEDIUM])
-            consistency_low = len([i for i in consistency_result.issues if i.severity == Severity.LOW])
-            
             if args.verbose:
-                print(f"  🔴 Critical: {consistency_critical}")
-                print(f"  🟡 Medium: {consistency_medium}")
-                print(f"  🔵 Low: {consistency_low}")
+                counts = consistency_result.severity_counts()
+                print(f"  🔴 Critical: {counts[Severity.CRITICAL]}")
+                print(f"  🟡 Medium: {counts[Severity.MEDIUM]}")
+                print(f"  🔵 Low: {counts[Severity.LOW]}")
         except Exception as e:
             print(f"  ❌ Error in consistency validation: {str(e)}")
     
@@ -2661,21 +2834,20 @@ def main():
             print(f"\n🧪 Performing test alignment validation...")
         try:
             # Use the simplified two-level validation approach
-            test_results = validator.map_and_validate_test_files_to_apis(api_files, test_dir)
+            test_results = validator.map_and_validate_test_files_to_apis(api_files, test_dir, args.jobs)
             
             if args.verbose:
                 for test_result in test_results:
-                    api_name = Path(test_result.api_file).stem
-                    test_critical = len([i for i in test_result.issues if i.severity == Severity.CRITICAL])
-                    test_medium = len([i for i in test_result.issues if i.severity == Severity.MEDIUM])
-                    test_low = len([i for i in test_result.issues if i.severity == Severity.LOW])
-                    print(f"  📋 {api_name}: {len(test_result.test_files)} test files, {test_critical} critical, {test_medium} medium, {test_low} low")
+                    api_name = os.path.splitext(os.path.basename(test_result.api_file))[0]
+                    counts = test_result.severity_counts()
+                    print(f"  📋 {api_name}: {len(test_result.test_files)} test files, "
+                          f"{counts[Severity.CRITICAL]} critical, {counts[Severity.MEDIUM]} medium, {counts[Severity.LOW]} low")
         except Exception as e:
             print(f"  ❌ Error in test validation: {str(e)}")
     
     # Generate reports
     try:
-        report_filename = generate_report(results, output_dir, repo_name, issue_number, 
+        report_filename = generate_report(results, abs_output_dir, repo_name, issue_number, 
                                         consistency_result, test_results, commonalities_version=commonalities_version)
         print(f"📄 Report generated: {report_filename}")
     except Exception as e:
@@ -2684,7 +2856,7 @@ def main():
         
         # Try to create a fallback summary
         try:
-            with open(f"{output_dir}/summary.md", "w") as f:
+            with open(Path(abs_output_dir) / "summary.md", "w", encoding="utf-8") as f:
                 f.write("❌ **Report Generation Failed**\n\n")
                 f.write(f"Error: {str(e)}\n\n")
                 f.write("Please check the workflow logs for details.\n")
@@ -2694,26 +2866,13 @@ def main():
             print(f"❌ Even fallback report failed: {str(fallback_error)}")
     
     # Calculate totals including consistency and test results
-    total_critical = sum(r.critical_count for r in results)
-    total_medium = sum(r.medium_count for r in results)
-    total_low = sum(r.low_count for r in results)
-    
-    if consistency_result:
-        total_critical += len([i for i in consistency_result.issues if i.severity == Severity.CRITICAL])
-        total_medium += len([i for i in consistency_result.issues if i.severity == Severity.MEDIUM])
-        total_low += len([i for i in consistency_result.issues if i.severity == Severity.LOW])
-    
-    if test_results:
-        for test_result in test_results:
-            total_critical += len([i for i in test_result.issues if i.severity == Severity.CRITICAL])
-            total_medium += len([i for i in test_result.issues if i.severity == Severity.MEDIUM])
-            total_low += len([i for i in test_result.issues if i.severity == Severity.LOW])
+    totals = _total_severity_counts(results, consistency_result, test_results)
+    total_critical = totals[Severity.CRITICAL]
+    total_medium = totals[Severity.MEDIUM]
+    total_low = totals[Severity.LOW]
     
     # API type summary
-    type_counts = {}
-    for result in results:
-        api_type = result.api_type.value
-        type_counts[api_type] = type_counts.get(api_type, 0) + 1
+    type_counts = Counter(result.api_type.value for result in results)
     
     print(f"\n🎯 **Review Complete** (Commonalities {commonalities_version})")
     if repo_name:
@@ -19,9 +19,12 @@ Examples:
 """
 
 import argparse
+import functools
+import json
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 try:
     import yaml
@@ -29,12 +32,47 @@ except ImportError:
     print("Error: pyyaml package is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Bundled schema, relative to this script: ../schemas/release-plan-schema.yaml
+BUNDLED_SCHEMA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'schemas', 'release-plan-schema.yaml'
+)
+
 try:
-    import jsonschema
-    from jsonschema import Draft7Validator, ValidationError
+    import orjson
 except ImportError:
-    print("Error: jsonschema package is required. Install with: pip install jsonschema")
-    sys.exit(1)
+    orjson = None  # optional: faster parsing for plans written as JSON
+
+
+def _import_jsonschema():
+    """Import jsonschema on first use; it is slow to load and not every run needs it."""
+    try:
+        import jsonschema
+    except ImportError:
+        print("Error: jsonschema package is required. Install with: pip install jsonschema")
+        sys.exit(1)
+    return jsonschema
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; mtime and size are part of the key so edits invalidate it.
+
+    The parsed document is shared between callers and must not be mutated.
+    """
+    with open(path, 'rb') as f:
+        # JSON is valid YAML, but a JSON parser reads .json plans much faster.
+        # Scalars follow JSON typing there (e.g. 1e3 is a float, where YAML 1.1
+        # reads it as a string); files that are not valid JSON go through YAML.
+        if path.lower().endswith('.json'):
+            data = f.read()
+            try:
+                return orjson.loads(data) if orjson is not None else json.loads(data)
+            except ValueError:
+                f.seek(0)
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
 class ReleasePlanValidator:
@@ -50,12 +88,13 @@ class ReleasePlanValidator:
         self.check_files = check_files
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self._schema_validator = None
 
     def load_yaml(self, file_path: Path) -> Dict[str, Any]:
         """Load and parse YAML file."""
         try:
-            with open(file_path, 'r') as f:
-                return yaml.safe_load(f)
+            stat = os.stat(file_path)
+            return _load_yaml_cached(os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
         except yaml.YAMLError as e:
             self.errors.append(f"YAML parsing error in {file_path}: {e}")
             return {}
@@ -65,17 +104,21 @@ class ReleasePlanValidator:
 
     def find_schema_file(self) -> Optional[Path]:
         """Find schema file relative to script location."""
-        script_dir = Path(__file__).parent
-        schema_dir = script_dir.parent / 'schemas'
-        schema_file = schema_dir / 'release-plan-schema.yaml'
-
-        if schema_file.exists():
-            return schema_file
+        if os.path.exists(BUNDLED_SCHEMA_FILE):
+            return Path(BUNDLED_SCHEMA_FILE)
         return None
 
+    def _get_schema_validator(self, schema: Dict[str, Any]):
+        """Return a validator for schema, building it only when the schema changes."""
+        if self._schema_validator is None or self._schema_validator.schema is not schema:
+            jsonschema = _import_jsonschema()
+            validator_cls = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+            self._schema_validator = validator_cls(schema)
+        return self._schema_validator
+
     def validate_schema(self, release_plan: Dict[str, Any], schema: Dict[str, Any]) -> bool:
         """Validate release plan against JSON schema. Collects all errors."""
-        validator = Draft7Validator(schema)
+        validator = self._get_schema_validator(schema)
         errors_found = False
 
         for error in validator.iter_errors(release_plan):
@@ -97,16 +140,19 @@ class ReleasePlanValidator:
         # Check release_track and meta_release consistency
         release_track = repo.get('release_track')
         meta_release = repo.get('meta_release')
-        self._check_track_consistency(release_track, meta_release)
+        if release_track or meta_release:
+            self._check_track_consistency(release_track, meta_release)
+
+        # There are no per-API semantic checks beyond schema validation yet.
+        # Note: 0.x versions with 'public' status are valid - they represent
+        # initial public releases that are not yet stable (pre-1.0).
 
         # Check target release type consistency
+        # ('none' has no constraints - repository is not targeting a release)
         target_release_type = repo.get('target_release_type')
-        if target_release_type:
-            self._check_release_type_consistency(target_release_type, apis)
-
-        # Check API status progression
-        for api in apis:
-            self._check_api_status(api)
+        if target_release_type and target_release_type != 'none':
+            statuses = [(api.get('api_name'), api.get('target_api_status')) for api in apis]
+            self._check_release_type_consistency(target_release_type, statuses)
 
     def _check_track_consistency(self, release_track: Optional[str], meta_release: Optional[str]) -> None:
         """Check that release_track and meta_release are consistent."""
@@ -126,9 +172,12 @@ class ReleasePlanValidator:
                 f"Allowed values: {', '.join(self.ALLOWED_META_RELEASES)}"
             )
 
-    def _check_release_type_consistency(self, release_type: str, apis: List[Dict]) -> None:
+    def _check_release_type_consistency(self, release_type: str,
+                                        statuses: List[Tuple[Optional[str], Optional[str]]]) -> None:
         """Check that API statuses align with repository target release type.
 
+        statuses holds one (api_name, target_api_status) pair per API, in plan order.
+
         Rules:
         - none: No constraints (repository not targeting a release)
         - pre-release-alpha: All APIs must be at least alpha (no draft)
@@ -136,13 +185,9 @@ class ReleasePlanValidator:
         - public-release: All APIs must be public
         - maintenance-release: All APIs must be public (can only patch released APIs)
         """
-        # 'none' has no constraints - repository is not targeting a release
-        if release_type == 'none':
-            pass
-
-        elif release_type == 'pre-release-alpha':
+        if release_type == 'pre-release-alpha':
             # All APIs must be at least alpha (alpha, rc, or public)
-            draft_apis = [api.get('api_name') for api in apis if api.get('target_api_status') == 'draft']
+            draft_apis = [name for name, status in statuses if status == 'draft']
             if draft_apis:
                 self.errors.append(
                     f"target_release_type is 'pre-release-alpha' but these APIs are 'draft': {', '.join(draft_apis)}"
@@ -150,8 +195,7 @@ class ReleasePlanValidator:
 
         elif release_type == 'pre-release-rc':
             # All APIs must be at least rc (rc or public)
-            invalid_apis = [api.get('api_name') for api in apis
-                           if api.get('target_api_status') in ['draft', 'alpha']]
+            invalid_apis = [name for name, status in statuses if status in ('draft', 'alpha')]
             if invalid_apis:
                 self.errors.append(
                     f"target_release_type is 'pre-release-rc' but these APIs are not rc/public: {', '.join(invalid_apis)}"
@@ -159,7 +203,7 @@ class ReleasePlanValidator:
 
         elif release_type == 'public-release':
             # All APIs must be public
-            non_public = [api.get('api_name') for api in apis if api.get('target_api_status') != 'public']
+            non_public = [name for name, status in statuses if status != 'public']
             if non_public:
                 self.errors.append(
                     f"target_release_type is 'public-release' but these APIs are not 'public': {', '.join(non_public)}"
@@ -167,32 +211,26 @@ class ReleasePlanValidator:
 
         elif release_type == 'maintenance-release':
             # Patch releases are for maintenance - all APIs should be public
-            non_public = [api.get('api_name') for api in apis if api.get('target_api_status') != 'public']
+            non_public = [name for name, status in statuses if status != 'public']
             if non_public:
                 self.errors.append(
                     f"target_release_type is 'maintenance-release' but these APIs are not 'public': {', '.join(non_public)}"
                 )
 
-    def _check_api_status(self, api: Dict) -> None:
-        """Check individual API status consistency.
-
-        Note: 0.x versions with 'public' status are valid - they represent
-        initial public releases that are not yet stable (pre-1.0).
-        The version number indicates API stability, not release status.
-        """
-        # Currently no per-API semantic checks beyond schema validation.
-        # Future checks could include:
-        # - Version format validation
-        # - Status progression rules
-        pass
-
     def check_file_existence(self, release_plan: Dict[str, Any]) -> None:
         """Check if referenced API files exist (optional check)."""
         if not self.check_files:
             return
 
         apis = release_plan.get('apis', [])
-        release_plan_dir = self.release_plan_file.parent
+        api_dir = os.path.join(os.path.dirname(self.release_plan_file), 'code', 'API_definitions')
+
+        # List the definitions directory once instead of stat-ing each file
+        try:
+            with os.scandir(api_dir) as entries:
+                present = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
 
         for api in apis:
             api_name = api.get('api_name')
@@ -203,8 +241,9 @@ class ReleasePlanValidator:
                 continue
 
             # Look for API definition file
-            api_file = release_plan_dir / 'code' / 'API_definitions' / f'{api_name}.yaml'
-            if not api_file.exists():
+            api_filename = f'{api_name}.yaml'
+            if api_filename not in present:
+                api_file = os.path.join(api_dir, api_filename)
                 self.warnings.append(
                     f"API definition file not found: {api_file} (status: {target_api_status})"
                 )
@@ -245,20 +284,22 @@ class ReleasePlanValidator:
 
     def report(self) -> None:
         """Print validation report."""
+        lines: List[str] = []
         if self.errors:
-            print("\nValidation FAILED:")
-            for error in self.errors:
-                print(f"  ERROR: {error}")
+            lines.append("\nValidation FAILED:")
+            lines.extend("  ERROR: " + error for error in self.errors)
 
         if self.warnings:
-            print("\nWarnings:")
-            for warning in self.warnings:
-                print(f"  WARNING: {warning}")
+            lines.append("\nWarnings:")
+            lines.extend("  WARNING: " + warning for warning in self.warnings)
 
         if not self.errors and not self.warnings:
-            print("\nValidation PASSED: No errors or warnings")
+            lines.append("\nValidation PASSED: No errors or warnings")
         elif not self.errors:
-            print("\nValidation PASSED with warnings")
+            lines.append("\nValidation PASSED with warnings")
+
+        # One write for the whole report instead of a print per line
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():